@@ -4,10 +4,27 @@ Handles content generation requests
 """
 
 from fastapi import APIRouter, HTTPException, status
-from app.models.requests import ContentGenerationRequest, EmailSendRequest
-from app.models.responses import ContentGenerationResponse, ErrorResponse, EmailSendResponse
-from app.services.content_service import content_service
-from app.services.email_service import email_service
+from fastapi.responses import StreamingResponse
+from app.core.executor import ExecutorSaturatedError, crew_executor
+from app.core.factory import crew_template_pool
+from app.core.research_cache import research_cache
+from app.core.search_client import search_cache
+from app.models.requests import BulkEmailSendRequest, ContentGenerationRequest, EmailSendRequest
+from app.models.responses import (
+    BulkEmailSendResponse,
+    ContentGenerationResponse,
+    EmailBatchStatusResponse,
+    ErrorResponse,
+    EmailSendResponse,
+    EmailStatusResponse,
+    TaskStatusResponse
+)
+from app.services.content_service import content_service, generation_flights
+from app.services.email_renderer import email_renderer
+from app.services.job_service import job_service
+from app.services.outbox_service import email_outbox
+from app.services.result_cache import result_cache
+from app.utils.helpers import format_sse_event
 from app.utils.logger import setup_logger
 from datetime import datetime
 
@@ -22,7 +39,8 @@ router = APIRouter(prefix="/content", tags=["Content Generation"])
     status_code=status.HTTP_200_OK,
     responses={
         400: {"model": ErrorResponse, "description": "Bad Request"},
-        500: {"model": ErrorResponse, "description": "Internal Server Error"}
+        500: {"model": ErrorResponse, "description": "Internal Server Error"},
+        503: {"model": ErrorResponse, "description": "Service Busy"}
     },
     summary="Generate Content",
     description="Generate AI-powered content based on provided parameters"
@@ -99,6 +117,14 @@ async def generate_content(request: ContentGenerationRequest):
             detail=str(ve)
         )
     
+    except ExecutorSaturatedError as se:
+        logger.warning(f"Generation rejected: {str(se)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(se),
+            headers={"Retry-After": "30"}
+        )
+    
     except Exception as e:
         logger.error(f"Content generation error: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -107,44 +133,168 @@ async def generate_content(request: ContentGenerationRequest):
         )
 
 
+@router.post(
+    "/generate/stream",
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Server-Sent Events stream"}
+    },
+    summary="Generate Content (Streaming Progress)",
+    description="Generate content and stream live agent/task progress as Server-Sent Events"
+)
+async def generate_content_stream(request: ContentGenerationRequest):
+    """
+    Generate content and stream progress events
+    
+    Accepts the same body as `/content/generate`. The response is a
+    `text/event-stream` where every event carries `stage`
+    (researcher, planner, writer) and `elapsed` seconds since the run started:
+    
+    - `run_started`, `task_started`, `task_completed`, `run_completed`
+    - `tool_call` and `search_finished` for each web search
+    - `topic_started` and `topic_completed` per topic when research runs in parallel
+    - `piece_started` and `piece_completed` per content type when writers run in
+      parallel (their `token` events then also carry the `piece`)
+    - `token` with a `delta` of writer output text, as the LLM produces it
+    - `complete` with the final ContentGenerationResponse in `result`
+    - `error` with `status_code` and `detail` if generation failed
+    
+    Args:
+        request: Content generation parameters (with optional email fields)
+    
+    Returns:
+        StreamingResponse: Server-Sent Events stream
+    """
+    logger.info(f"Received streaming generation request for topics: {request.content_topics}")
+    
+    async def event_stream():
+        async for event in content_service.stream_content(request.model_dump()):
+            if event["event"] == "complete":
+                event["result"] = ContentGenerationResponse(**event["result"]).model_dump()
+            yield format_sse_event(event)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post(
+    "/jobs",
+    response_model=TaskStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        500: {"model": ErrorResponse, "description": "Internal Server Error"}
+    },
+    summary="Submit Content Generation Job",
+    description="Queue a content generation run and return a task id immediately"
+)
+async def submit_generation_job(request: ContentGenerationRequest):
+    """
+    Submit a content generation job
+    
+    Accepts the same body as `/content/generate` but returns right away with a
+    `task_id`. Poll `GET /content/jobs/{task_id}` until the status is
+    `completed` (the generated content is in `result`) or `failed`.
+    
+    Jobs are stored locally, so they survive server restarts.
+    
+    Args:
+        request: Content generation parameters (with optional email fields)
+    
+    Returns:
+        TaskStatusResponse: Newly created job (status pending)
+    
+    Raises:
+        HTTPException: If the job cannot be stored
+    """
+    try:
+        logger.info(f"Received generation job for topics: {request.content_topics}")
+        job = await job_service.submit(request.model_dump())
+        return TaskStatusResponse(**job)
+    
+    except Exception as e:
+        logger.error(f"Job submission error: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Job submission failed: {str(e)}"
+        )
+
+
+@router.get(
+    "/jobs/{task_id}",
+    response_model=TaskStatusResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Job Not Found"}
+    },
+    summary="Get Content Generation Job",
+    description="Get the status and result of a content generation job"
+)
+async def get_generation_job(task_id: str):
+    """
+    Get a content generation job
+    
+    Args:
+        task_id: Job identifier returned by `POST /content/jobs`
+    
+    Returns:
+        TaskStatusResponse: Job status, with result once completed
+    
+    Raises:
+        HTTPException: If the job does not exist
+    """
+    job = job_service.get(task_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {task_id}"
+        )
+    return TaskStatusResponse(**job)
+
+
 @router.post(
     "/send-email",
     response_model=EmailSendResponse,
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
     responses={
         400: {"model": ErrorResponse, "description": "Bad Request"},
         500: {"model": ErrorResponse, "description": "Internal Server Error"}
     },
     summary="Send Content via Email",
-    description="Send AI-generated content to a recipient via email"
+    description="Queue AI-generated content for delivery to a recipient via email"
 )
 async def send_content_email(request: EmailSendRequest):
     """
     Send generated content via email
     
-    This endpoint sends the AI-generated content to a specified email address
-    with beautiful HTML formatting.
+    This endpoint queues the AI-generated content for delivery to a specified
+    email address with beautiful HTML formatting, and returns immediately with
+    an `email_id`. Poll `GET /content/emails/{email_id}` for the delivery status.
     
     Features:
     - Beautiful HTML email template
     - Markdown to HTML conversion
     - Plain text fallback
     - Professional styling
+    - Persistent outbox with automatic retries
     
     Args:
         request: Email send parameters (recipient, subject, content)
     
     Returns:
-        EmailSendResponse: Send status and confirmation
+        EmailSendResponse: Queue status and email id
     
     Raises:
-        HTTPException: If validation or sending fails
+        HTTPException: If validation or queueing fails
     """
     try:
         logger.info(f"Received email send request for: {request.recipient_email}")
         
-        # Send email
-        result = email_service.send_content_email(
+        # Queue email
+        email = email_outbox.enqueue(
             to=request.recipient_email,
             subject=request.subject,
             content=request.content,
@@ -152,14 +302,12 @@ async def send_content_email(request: EmailSendRequest):
             content_types=request.content_types
         )
         
-        if result["status"] == "success":
-            logger.info(f"Email sent successfully to {request.recipient_email}")
-            return EmailSendResponse(**result)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=result["message"]
-            )
+        return EmailSendResponse(
+            status=email["status"],
+            message=f"Email to {request.recipient_email} queued for delivery",
+            timestamp=email["created_at"],
+            email_id=email["email_id"]
+        )
     
     except ValueError as ve:
         logger.error(f"Validation error: {str(ve)}")
@@ -168,15 +316,139 @@ async def send_content_email(request: EmailSendRequest):
             detail=str(ve)
         )
     
-    except HTTPException:
-        raise
+    except Exception as e:
+        logger.error(f"Email queue error: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue email: {str(e)}"
+        )
+
+
+@router.post(
+    "/send-email/bulk",
+    response_model=BulkEmailSendResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request"},
+        500: {"model": ErrorResponse, "description": "Internal Server Error"}
+    },
+    summary="Send Content to Many Recipients",
+    description="Render content once and queue it for delivery to every recipient"
+)
+async def send_bulk_content_email(request: BulkEmailSendRequest):
+    """
+    Send generated content to a list of recipients
+    
+    The content is rendered once for the whole batch, then one email per
+    recipient is queued in the outbox. Emails are delivered concurrently
+    under the outbox rate limit (EMAIL_SEND_RATE) with the usual retries.
+    Poll `GET /content/emails/batches/{batch_id}` for per-recipient status.
+    
+    Args:
+        request: Bulk send parameters (recipients, subject, content)
+    
+    Returns:
+        BulkEmailSendResponse: Batch id and one email id per recipient
+    
+    Raises:
+        HTTPException: If validation or queueing fails
+    """
+    try:
+        logger.info(f"Received bulk email request for {len(request.recipient_emails)} recipient(s)")
+        
+        batch = await email_outbox.enqueue_batch(
+            recipients=request.recipient_emails,
+            subject=request.subject,
+            content=request.content,
+            topics=request.topics,
+            content_types=request.content_types
+        )
+        
+        return BulkEmailSendResponse(
+            batch_id=batch["batch_id"],
+            status="queued",
+            message=f"{len(batch['emails'])} email(s) queued for delivery",
+            timestamp=batch["created_at"],
+            recipients=batch["emails"]
+        )
+    
+    except ValueError as ve:
+        logger.error(f"Validation error: {str(ve)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(ve)
+        )
     
     except Exception as e:
-        logger.error(f"Email send error: {str(e)}", exc_info=True)
+        logger.error(f"Bulk email queue error: {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to send email: {str(e)}"
+            detail=f"Failed to queue emails: {str(e)}"
+        )
+
+
+@router.get(
+    "/emails/batches/{batch_id}",
+    response_model=EmailBatchStatusResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Batch Not Found"}
+    },
+    summary="Get Bulk Send Status",
+    description="Get the delivery status of every recipient of a bulk send"
+)
+async def get_email_batch_status(batch_id: str):
+    """
+    Get the delivery status of a bulk send
+    
+    Args:
+        batch_id: Batch id returned by `POST /content/send-email/bulk`
+    
+    Returns:
+        EmailBatchStatusResponse: Counts by status and each recipient's email
+    
+    Raises:
+        HTTPException: If the batch does not exist
+    """
+    batch = email_outbox.get_batch(batch_id)
+    if batch is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Email batch not found: {batch_id}"
+        )
+    return EmailBatchStatusResponse(**batch)
+
+
+@router.get(
+    "/emails/{email_id}",
+    response_model=EmailStatusResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        404: {"model": ErrorResponse, "description": "Email Not Found"}
+    },
+    summary="Get Email Status",
+    description="Get the delivery status of a queued email"
+)
+async def get_email_status(email_id: str):
+    """
+    Get the delivery status of an email
+    
+    Args:
+        email_id: Email id returned by `POST /content/send-email` or auto-send
+    
+    Returns:
+        EmailStatusResponse: Status, attempts and last error
+    
+    Raises:
+        HTTPException: If the email does not exist
+    """
+    email = email_outbox.get(email_id)
+    if email is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Email not found: {email_id}"
         )
+    return EmailStatusResponse(**email)
 
 
 @router.get(
@@ -195,5 +467,13 @@ async def content_health():
     return {
         "service": "content_generation",
         "status": "healthy",
+        "executor": crew_executor.stats(),
+        "template_pool": crew_template_pool.stats(),
+        "search_cache": search_cache.stats(),
+        "research_cache": research_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "generation_flights": generation_flights.stats(),
+        "email_outbox": email_outbox.stats(),
+        "email_render_cache": email_renderer.stats(),
         "timestamp": datetime.now().isoformat()
     }
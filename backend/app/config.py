@@ -24,18 +24,69 @@ class Settings(BaseSettings):
     PORT: int = 8000
     DEBUG: bool = False
     
-    # AI Model Configuration
-    GOOGLE_API_KEY: str
-    TAVILY_API_KEY: str
+    # AI Model Configuration (checked on first use, so the API can start without them)
+    GOOGLE_API_KEY: Optional[str] = None
+    TAVILY_API_KEY: Optional[str] = None
     
     # LLM Settings
     LLM_MODEL: str = "gemini/gemini-2.5-flash-lite"
     LLM_MAX_TOKENS: int = 4096
     LLM_TEMPERATURE: float = 0.7
+    WRITER_STREAMING: bool = True  # Stream writer tokens to /content/generate/stream
     
     # Search Configuration
+    TAVILY_API_URL: str = "https://api.tavily.com"
     SEARCH_MAX_RESULTS: int = 3
     SEARCH_DEPTH: str = "advanced"
+    SEARCH_MAX_CONCURRENCY: int = 4  # Concurrent Tavily requests per process
+    SEARCH_DIGEST_TOKEN_BUDGET: int = 800  # Max tokens of search results per tool call
+    SEARCH_SNIPPET_MAX_CHARS: int = 400
+    MULTI_SEARCH_MAX_QUERIES: int = 5  # Queries accepted per Multi Search call
+    
+    # Pipeline Profiles (latency budgets in seconds)
+    FAST_PROFILE_LATENCY_BUDGET: float = 60
+    STANDARD_PROFILE_LATENCY_BUDGET: float = 180
+    DEEP_PROFILE_LATENCY_BUDGET: float = 420
+    DEEP_PROFILE_SEARCH_MAX_RESULTS: int = 8
+    
+    # Search Result Cache (memory LRU in front of the disk cache)
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL: int = 3600  # seconds
+    SEARCH_CACHE_MAX_ENTRIES: int = 512
+    SEARCH_CACHE_MAX_DISK_ENTRIES: int = 10000
+    
+    # Research Artifact Cache (research reports reused across requests)
+    RESEARCH_CACHE_ENABLED: bool = True
+    RESEARCH_CACHE_TTL: int = 21600  # seconds
+    RESEARCH_CACHE_MAX_ENTRIES: int = 256
+    RESEARCH_CACHE_MAX_DISK_ENTRIES: int = 2000
+    
+    # Generation Result Cache (opt-in; identical briefs return the stored result)
+    RESULT_CACHE_ENABLED: bool = False
+    RESULT_CACHE_TTL: int = 86400  # seconds
+    RESULT_CACHE_MAX_ENTRIES: int = 128
+    RESULT_CACHE_MAX_DISK_ENTRIES: int = 1000
+    
+    # Crew Execution (worker pool for blocking crew runs)
+    CREW_EXECUTOR_MODE: str = "thread"  # "thread" or "process"
+    CREW_MAX_CONCURRENCY: int = 4
+    CREW_MAX_QUEUE_SIZE: int = 16
+    CREW_TEMPLATE_POOL_SIZE: int = 4  # Pre-built agent/task sets per process (0 disables)
+    RESEARCH_MODE: str = "sequential"  # "sequential" or "parallel" (one research run per topic)
+    RESEARCH_MAX_PARALLEL: int = 5
+    WRITER_MODE: str = "single"  # "single" or "parallel" (one writer run per content type)
+    WRITER_MAX_PARALLEL: int = 4
+    
+    # Agent Budgets (per crew run)
+    RESEARCHER_MAX_ITER: int = 10
+    PLANNER_MAX_ITER: int = 6
+    WRITER_MAX_ITER: int = 5
+    RESEARCHER_MAX_TOOL_CALLS: int = 6  # Each Multi Search query counts as one call
+    PLANNER_MAX_TOOL_CALLS: int = 2
+    
+    # Persistence (relative paths are resolved against the backend folder)
+    JOB_STORE_PATH: str = "data/jobs.db"
+    CACHE_STORE_PATH: str = "data/cache.db"  # Empty disables the disk cache tier
     
     # CORS Settings
     CORS_ORIGINS: list = ["*"]
@@ -43,22 +94,51 @@ class Settings(BaseSettings):
     CORS_ALLOW_METHODS: list = ["*"]
     CORS_ALLOW_HEADERS: list = ["*"]
     
+    # Email Delivery
+    EMAIL_BACKEND: str = "gmail"  # "gmail" (Gmail API with OAuth) or "smtp" (SMTP settings below)
+    
     # Email Configuration (SMTP)
     SMTP_SERVER: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
     SMTP_USER: Optional[str] = None
     SMTP_PASSWORD: Optional[str] = None
-    FROM_EMAIL: Optional[str] = None
+    FROM_EMAIL: Optional[str] = None  # Defaults to SMTP_USER
+    SMTP_USE_TLS: bool = False  # Implicit TLS (port 465); otherwise STARTTLS is used when offered
+    SMTP_TIMEOUT: float = 30
+    SMTP_IDLE_TIMEOUT: float = 60  # Close pooled connections unused for this many seconds
     
     # Gmail API Configuration (Optional - for OAuth)
     GMAIL_CREDENTIALS_PATH: str = "credentials.json"
     GMAIL_TOKEN_PATH: str = "token.json"
     USE_GMAIL_API: bool = False
+    GMAIL_API_ENDPOINT: Optional[str] = None  # Override the Gmail API host (e.g. a local stand-in)
+    GMAIL_TOKEN_REFRESH_MARGIN: int = 300  # Refresh the access token this many seconds before expiry
+    
+    # Email Rendering (markdown converted to HTML is memoized by content hash, in memory)
+    EMAIL_RENDER_CACHE_ENABLED: bool = True
+    EMAIL_RENDER_CACHE_TTL: int = 3600  # seconds
+    EMAIL_RENDER_CACHE_MAX_ENTRIES: int = 64
+    
+    # Email Outbox (emails are queued and delivered by a background worker)
+    EMAIL_OUTBOX_PATH: str = "data/outbox.db"
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_RETRY_BASE_DELAY: float = 5  # seconds, doubled after every failed attempt
+    EMAIL_RETRY_MAX_DELAY: float = 600
+    EMAIL_SEND_RATE: float = 2.0  # sends per second (Gmail: 250 quota units/s per user, 100 per send)
+    EMAIL_SEND_BURST: int = 5
+    EMAIL_WORKER_CONCURRENCY: int = 4  # Concurrent sends (Gmail sender threads / pooled SMTP connections)
+    EMAIL_BULK_MAX_RECIPIENTS: int = 500  # Recipients accepted by one bulk send
     
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     
+    # Metrics (Prometheus endpoint at /metrics)
+    METRICS_ENABLED: bool = True
+    
+    # Startup (crews and Gmail are initialized in the background after startup)
+    WARM_UP_ENABLED: bool = True
+    
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -3,14 +3,102 @@ Crew Orchestration
 Manages the CrewAI team execution and workflow
 """
 
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from crewai import Crew, Process
-from typing import Dict, Any
-from app.core.agents import researcher, planner, writer
-from app.core.tasks import research_task, planning_task, writing_task
+from crewai.events import LLMStreamChunkEvent, crewai_event_bus
+from typing import Dict, Any, List, Optional
+from app.config import settings
+from app.core.factory import (
+    CrewComponents,
+    build_piece_writer,
+    build_topic_researcher,
+    crew_template_pool
+)
+from app.core.research_cache import research_cache, research_cache_key
+from app.core.profiles import PipelineProfile, get_profile
+from app.core.tasks import build_planning_task, build_writing_task
+from app.core.run_context import RunContext, activate_run, get_current_run
+from app.utils.helpers import split_content_types
 from app.utils.logger import setup_logger
+from app.utils.metrics import record_token_usage
 
 logger = setup_logger(__name__)
 
+# Placed between content pieces written in parallel
+PIECE_SEPARATOR = "\n\n---\n\n"
+
+# Stages whose LLM output is forwarded token by token
+TOKEN_STREAMING_STAGES = ("writer",)
+
+# Content type being written by the current thread (parallel writers only)
+_current_piece: ContextVar[Optional[str]] = ContextVar("current_piece", default=None)
+
+
+def get_tool_call_limits(profile: Optional[PipelineProfile] = None) -> Dict[str, int]:
+    """
+    Get the per-stage tool call budgets for a run
+    
+    Args:
+        profile: Pipeline profile scaling the budgets (defaults to "standard")
+    
+    Returns:
+        Dict[str, int]: Maximum tool calls per stage
+    """
+    factor = (profile or get_profile()).tool_call_factor
+    return {
+        "researcher": max(1, round(settings.RESEARCHER_MAX_TOOL_CALLS * factor)),
+        "planner": max(1, round(settings.PLANNER_MAX_TOOL_CALLS * factor))
+    }
+
+
+def _on_task_completed(output: Any) -> None:
+    """Report a finished task to the active run (if any)"""
+    run = get_current_run()
+    if run is not None:
+        run.complete_stage(output_chars=len(getattr(output, "raw", "") or ""))
+
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _on_llm_stream_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+    """Forward streamed writer text to the active run as token events"""
+    # Stream chunk handlers run inline in the LLM's thread, so the run
+    # context of the crew that issued the call is visible here
+    run = get_current_run()
+    if run is None or run.current_stage not in TOKEN_STREAMING_STAGES:
+        return
+    if event.tool_call is not None or not event.chunk:
+        return
+    piece = _current_piece.get()
+    if piece is None:
+        run.emit("token", delta=event.chunk)
+    else:
+        # Pieces stream concurrently, so tag each token with its piece
+        run.emit("token", delta=event.chunk, piece=piece)
+
+
+def merge_research_reports(reports: List[Dict[str, Any]]) -> str:
+    """
+    Combine per-topic research into a single report for the planner
+    
+    Args:
+        reports: One entry per topic, in request order, with `topic` and
+            either `report` or `error`
+    
+    Returns:
+        str: Merged research report
+    """
+    sections = []
+    for entry in reports:
+        if "error" in entry:
+            body = f"Research for this topic failed: {entry['error']}"
+        else:
+            body = entry["report"].strip()
+        sections.append(f"## Topic: {entry['topic']}\n\n{body}")
+    return "\n\n".join(sections)
+
 
 class ContentCrew:
     """
@@ -18,17 +106,275 @@ class ContentCrew:
     Manages the execution of AI agents to generate content
     """
     
-    def __init__(self):
-        """Initialize the content generation crew"""
+    def __init__(
+        self,
+        components: Optional[CrewComponents] = None,
+        profile: Optional[PipelineProfile] = None
+    ):
+        """
+        Initialize the content generation crew
+        
+        Args:
+            components: Agents and tasks for this crew (taken from the
+                template pool if omitted); they must not be shared with another crew
+            profile: Pipeline profile selecting the stages (defaults to "standard")
+        """
+        self.components = components or crew_template_pool.acquire()
+        self.profile = profile or get_profile()
         self.crew = Crew(
-            agents=[researcher, planner, writer],
-            tasks=[research_task, planning_task, writing_task],
+            agents=[self.components.agents[stage] for stage in self.profile.stages],
+            tasks=[self.components.tasks[stage] for stage in self.profile.stages],
+            process=Process.sequential,
+            task_callback=_on_task_completed,
+            verbose=True
+        )
+        logger.info(f"ContentCrew initialized with sequential process ({self.profile.name} profile)")
+    
+    def _use_parallel_research(self, inputs: Dict[str, Any]) -> bool:
+        """Whether topics are researched concurrently for these inputs"""
+        return (
+            settings.RESEARCH_MODE == "parallel"
+            and len(inputs.get("content_topics") or []) > 1
+        )
+    
+    def _research_topic(self, topic: str, inputs: Dict[str, Any], run: RunContext) -> str:
+        """
+        Research a single topic in its own one-task crew
+        
+        Args:
+            topic: Topic to research
+            inputs: Crew inputs
+            run: Active run context
+        
+        Returns:
+            str: Research report for the topic
+        """
+        started_at = time.perf_counter()
+        run.emit("topic_started", topic=topic)
+        components = build_topic_researcher()
+        crew = Crew(
+            agents=[components.agents["researcher"]],
+            tasks=[components.tasks["researcher"]],
+            process=Process.sequential,
+            verbose=True
+        )
+        output = crew.kickoff(inputs={**inputs, "content_topics": [topic]})
+        record_token_usage(getattr(output, "token_usage", None), self.profile.name)
+        report = str(output)
+        run.emit(
+            "topic_completed",
+            topic=topic,
+            output_chars=len(report),
+            duration=round(time.perf_counter() - started_at, 3)
+        )
+        return report
+    
+    def _run_parallel_research(self, inputs: Dict[str, Any], run: RunContext) -> str:
+        """
+        Research every topic concurrently (map) and merge the findings (reduce)
+        
+        Args:
+            inputs: Crew inputs
+            run: Active run context
+        
+        Returns:
+            str: Merged research report
+        
+        Raises:
+            RuntimeError: If research failed for every topic
+        """
+        topics = list(inputs["content_topics"])
+        # Topics share the research stage, so its tool budget grows with their number
+        limit = run.tool_call_limits.get("researcher")
+        if limit is not None:
+            run.tool_call_limits["researcher"] = limit * len(topics)
+        
+        workers = max(1, min(len(topics), settings.RESEARCH_MAX_PARALLEL))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="topic-research") as pool:
+            # Each topic runs in a copy of this context so its tools still see the run
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._research_topic, topic, inputs, run)
+                for topic in topics
+            ]
+            reports = []
+            for topic, future in zip(topics, futures):
+                try:
+                    reports.append({"topic": topic, "report": future.result()})
+                except Exception as e:
+                    logger.error(f"Research failed for topic '{topic}': {str(e)}")
+                    run.emit("topic_completed", topic=topic, error=str(e))
+                    reports.append({"topic": topic, "error": str(e)})
+        
+        if all("error" in entry for entry in reports):
+            raise RuntimeError(f"Research failed for all topics: {reports[0]['error']}")
+        
+        merged = merge_research_reports(reports)
+        run.complete_stage(output_chars=len(merged), topics=len(topics))
+        return merged
+    
+    def _writer_content_types(self, inputs: Dict[str, Any]) -> List[str]:
+        """Content types written concurrently for these inputs (empty for a single writer)"""
+        if settings.WRITER_MODE != "parallel" or not self.profile.parallel_writers:
+            return []
+        content_types = split_content_types(inputs.get("content_types", ""))
+        return content_types if len(content_types) > 1 else []
+    
+    def _write_piece(self, content_type: str, inputs: Dict[str, Any], run: RunContext) -> str:
+        """
+        Write the piece for a single content type in its own one-task crew
+        
+        Args:
+            content_type: Content type to write
+            inputs: Crew inputs, including `content_plan`
+            run: Active run context
+        
+        Returns:
+            str: Written piece
+        """
+        started_at = time.perf_counter()
+        _current_piece.set(content_type)
+        run.emit("piece_started", piece=content_type)
+        components = build_piece_writer()
+        crew = Crew(
+            agents=[components.agents["writer"]],
+            tasks=[components.tasks["writer"]],
             process=Process.sequential,
             verbose=True
         )
-        logger.info("ContentCrew initialized with sequential process")
+        output = crew.kickoff(inputs={**inputs, "content_types": content_type})
+        record_token_usage(getattr(output, "token_usage", None), self.profile.name)
+        piece = str(output)
+        run.emit(
+            "piece_completed",
+            piece=content_type,
+            output_chars=len(piece),
+            duration=round(time.perf_counter() - started_at, 3)
+        )
+        return piece
     
-    def generate_content(self, inputs: Dict[str, Any]) -> Any:
+    def _run_parallel_writers(
+        self,
+        inputs: Dict[str, Any],
+        content_plan: str,
+        content_types: List[str],
+        run: RunContext
+    ) -> str:
+        """
+        Write every content type concurrently from the shared plan and assemble them
+        
+        Args:
+            inputs: Crew inputs
+            content_plan: Research findings and content plan
+            content_types: Content types to write, in output order
+            run: Active run context
+        
+        Returns:
+            str: All pieces, in content type order
+        """
+        piece_inputs = {**inputs, "content_plan": content_plan}
+        workers = max(1, min(len(content_types), settings.WRITER_MAX_PARALLEL))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="piece-writer") as pool:
+            # Each piece runs in a copy of this context so its callbacks still see the run
+            futures = [
+                pool.submit(contextvars.copy_context().run, self._write_piece, content_type, piece_inputs, run)
+                for content_type in content_types
+            ]
+            pieces = [future.result() for future in futures]
+        
+        content = PIECE_SEPARATOR.join(piece.strip() for piece in pieces)
+        run.complete_stage(output_chars=len(content), pieces=len(pieces))
+        return content
+    
+    def _research_key(self, inputs: Dict[str, Any]) -> Optional[str]:
+        """Research cache key for these inputs (None when the cache is not used)"""
+        if not settings.RESEARCH_CACHE_ENABLED or inputs.get("bypass_cache"):
+            return None
+        return research_cache_key(inputs, self.profile)
+    
+    def _store_research(self, research_key: Optional[str], report: str) -> None:
+        """Keep a finished research report for later runs"""
+        if research_key is not None and report:
+            research_cache.set(research_key, report)
+    
+    def _run_staged(
+        self,
+        inputs: Dict[str, Any],
+        run: RunContext,
+        research_key: Optional[str] = None,
+        cached_report: Optional[str] = None
+    ) -> Any:
+        """
+        Run the pipeline with research reused or fanned out, and/or writing fanned out
+        
+        Args:
+            inputs: Crew inputs
+            run: Active run context
+            research_key: Research cache key (None when the cache is not used)
+            cached_report: Research report from the cache, if any
+        
+        Returns:
+            CrewOutput or str: Generated content
+        """
+        crew_inputs = dict(inputs)
+        agents = []
+        tasks = []
+        
+        if cached_report is not None:
+            logger.info("Research cache hit, skipping the research stage")
+            crew_inputs["research_report"] = cached_report
+            run.complete_stage(output_chars=len(cached_report), cached=True)
+        elif self._use_parallel_research(inputs):
+            crew_inputs["research_report"] = self._run_parallel_research(inputs, run)
+            self._store_research(research_key, crew_inputs["research_report"])
+        else:
+            agents.append(self.components.agents["researcher"])
+            tasks.append(self.components.tasks["researcher"])
+        
+        with_research_report = "research_report" in crew_inputs
+        with_planner = "planner" in self.profile.stages
+        if with_planner:
+            planner = self.components.agents["planner"]
+            agents.append(planner)
+            tasks.append(
+                build_planning_task(planner, with_research_report=True)
+                if with_research_report else self.components.tasks["planner"]
+            )
+        
+        content_types = self._writer_content_types(inputs)
+        if not content_types:
+            writer = self.components.agents["writer"]
+            agents.append(writer)
+            if with_research_report and not with_planner:
+                # Nothing runs before the writer, so it gets the report as its plan
+                crew_inputs["content_plan"] = crew_inputs["research_report"]
+                tasks.append(build_writing_task(writer, with_content_plan=True))
+            else:
+                tasks.append(self.components.tasks["writer"])
+        
+        outputs = []
+        result = None
+        if tasks:
+            crew = Crew(
+                agents=agents,
+                tasks=tasks,
+                process=Process.sequential,
+                task_callback=_on_task_completed,
+                verbose=True
+            )
+            result = crew.kickoff(inputs=crew_inputs)
+            record_token_usage(getattr(result, "token_usage", None), self.profile.name)
+            outputs = [output.raw for output in result.tasks_output]
+        if not with_research_report:
+            self._store_research(research_key, outputs[0])
+        if not content_types:
+            return result
+        
+        # Writers see what the single writer would have: research followed by the plan
+        findings = [crew_inputs["research_report"]] if with_research_report else []
+        findings.extend(outputs)
+        return self._run_parallel_writers(inputs, "\n\n".join(findings), content_types, run)
+    
+    def generate_content(self, inputs: Dict[str, Any], run: Optional[RunContext] = None) -> Any:
         """
         Execute the crew to generate content
         
@@ -41,30 +387,61 @@ class ContentCrew:
                 - content_types: Types of content to create
                 - brand_voice: Brand voice/tone
                 - additional_notes: Optional additional instructions
+            run: Optional run context receiving progress events (it should
+                carry the same profile as this crew)
         
         Returns:
-            CrewOutput: Generated content
+            CrewOutput or str: Generated content
         """
         try:
             logger.info(f"Starting content generation for topics: {inputs.get('content_topics')}")
             logger.info(f"Content types: {inputs.get('content_types')}")
             
-            # Execute crew
-            result = self.crew.kickoff(inputs=inputs)
+            # Execute crew (tools and callbacks see the run via its context)
+            run = run or RunContext(
+                tool_call_limits=get_tool_call_limits(self.profile),
+                profile=self.profile
+            )
+            with activate_run(run):
+                run.start(self.profile.stages)
+                research_key = self._research_key(inputs)
+                cached_report = research_cache.get(research_key) if research_key else None
+                if (
+                    cached_report is not None
+                    or self._use_parallel_research(inputs)
+                    or self._writer_content_types(inputs)
+                ):
+                    result = self._run_staged(inputs, run, research_key, cached_report)
+                else:
+                    result = self.crew.kickoff(inputs=inputs)
+                    record_token_usage(getattr(result, "token_usage", None), self.profile.name)
+                    self._store_research(research_key, result.tasks_output[0].raw)
+                run.finish()
             
-            logger.info("Content generation completed successfully")
+            logger.info(
+                f"Content generation completed successfully in {run.elapsed()}s "
+                f"({self.profile.name} profile, budget {self.profile.latency_budget}s)"
+            )
+            logger.info(f"Run stats: {run.stats()}")
             return result
             
         except Exception as e:
             logger.error(f"Content generation failed: {str(e)}")
+            if run is not None:
+                run.emit("run_failed", detail=str(e))
             raise
 
 
-def create_content_crew() -> ContentCrew:
+def create_content_crew(profile: Optional[PipelineProfile] = None) -> ContentCrew:
     """
     Factory function to create a new ContentCrew instance
     
+    Every crew gets its own agents and tasks, so concurrent runs are isolated.
+    
+    Args:
+        profile: Pipeline profile (defaults to "standard")
+    
     Returns:
         ContentCrew: New content crew instance
     """
-    return ContentCrew()
+    return ContentCrew(profile=profile)
@@ -0,0 +1,160 @@
+"""
+Crew Executor
+Runs blocking crew executions on a bounded worker pool
+"""
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+from app.core.profiles import get_profile
+from app.core.run_context import EventSink, RunContext
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when every worker is busy and the waiting queue is full"""
+
+
+def run_crew(inputs: Dict[str, Any], sink: Optional[EventSink] = None) -> Dict[str, Any]:
+    """
+    Build a content crew and execute it inside a worker
+
+    Args:
+        inputs: Crew inputs (see ContentCrew.generate_content)
+        sink: Optional progress event sink (thread mode only)
+
+    Returns:
+        Dict: `content` (raw crew output as text) and `run_stats`, plain
+            data so it can cross process boundaries
+    """
+    # Imported here so only workers (and the warm-up) pay for importing crewai
+    from app.core.crew import create_content_crew, get_tool_call_limits
+
+    profile = get_profile(inputs.get("profile"))
+    crew = create_content_crew(profile)
+    run = RunContext(sink, tool_call_limits=get_tool_call_limits(profile), profile=profile)
+    result = crew.generate_content(inputs=inputs, run=run)
+    return {"content": str(result), "run_stats": run.stats()}
+
+
+class CrewExecutor:
+    """
+    Bounded executor for crew runs
+
+    At most `max_concurrency` runs execute at once and at most
+    `max_queue_size` further runs wait for a worker. Anything beyond that
+    is rejected with ExecutorSaturatedError instead of piling up.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue_size: Optional[int] = None
+    ):
+        """Configure the executor (the worker pool itself is created lazily)"""
+        self.mode = (mode or settings.CREW_EXECUTOR_MODE).lower()
+        if self.mode not in EXECUTOR_MODES:
+            raise ValueError(
+                f"Invalid crew executor mode '{self.mode}', expected one of {EXECUTOR_MODES}"
+            )
+
+        self.max_concurrency = max(1, max_concurrency or settings.CREW_MAX_CONCURRENCY)
+        self.max_queue_size = max(
+            0, settings.CREW_MAX_QUEUE_SIZE if max_queue_size is None else max_queue_size
+        )
+        self._executor: Optional[Executor] = None
+        self._active = 0
+
+    @property
+    def capacity(self) -> int:
+        """Total number of runs accepted at once (running + waiting)"""
+        return self.max_concurrency + self.max_queue_size
+
+    @property
+    def supports_progress(self) -> bool:
+        """Whether progress sinks can be passed to workers (not picklable across processes)"""
+        return self.mode == "thread"
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool on first use"""
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="crew-worker"
+                )
+            logger.info(
+                f"Crew executor started: mode={self.mode}, "
+                f"max_concurrency={self.max_concurrency}, max_queue_size={self.max_queue_size}"
+            )
+        return self._executor
+
+    def _release(self, _future: Future) -> None:
+        """Free a slot once the underlying work has really finished"""
+        self._active -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking callable on the worker pool without blocking the event loop
+
+        Args:
+            fn: Callable to execute (must be picklable in process mode)
+            *args: Positional arguments for the callable
+
+        Returns:
+            Any: Return value of the callable
+
+        Raises:
+            ExecutorSaturatedError: If no worker or queue slot is available
+        """
+        if self._active >= self.capacity:
+            logger.warning(f"Crew executor saturated: {self.stats()}")
+            raise ExecutorSaturatedError(
+                "Server is busy generating other content, please retry shortly"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(fn, *args)
+        self._active += 1
+        # The slot is released when the work ends, not when the caller stops
+        # waiting, so a disconnected client cannot overcommit the pool
+        future.add_done_callback(
+            lambda f: loop.call_soon_threadsafe(self._release, f)
+        )
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get current executor load
+
+        Returns:
+            Dict: Mode, limits and running/waiting counts
+        """
+        running = min(self._active, self.max_concurrency)
+        return {
+            "mode": self.mode,
+            "max_concurrency": self.max_concurrency,
+            "max_queue_size": self.max_queue_size,
+            "running": running,
+            "waiting": self._active - running
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker pool, dropping runs that have not started yet"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("Crew executor shut down")
+
+
+# Create executor instance
+crew_executor = CrewExecutor()
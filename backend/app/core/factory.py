@@ -0,0 +1,201 @@
+"""
+Crew Factory
+Builds isolated agent/task sets per run, backed by a warm template pool
+
+crewai takes seconds to import, so the agent and task builders are
+imported on first build (normally by the background warm-up) rather
+than when the app starts.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from app.config import settings
+from app.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from crewai import Agent, Task
+
+logger = setup_logger(__name__)
+
+
+class CrewComponents:
+    """
+    One isolated set of agents and tasks for a single crew run
+
+    Agents, tasks and their LLMs are never shared between runs, so
+    concurrent generations cannot mutate each other's state.
+    """
+
+    def __init__(self, agents: Dict[str, "Agent"], tasks: Dict[str, "Task"]):
+        """Initialize the component set"""
+        self.agents = agents
+        self.tasks = tasks
+
+
+def build_crew_components() -> CrewComponents:
+    """
+    Build a fresh set of agents and tasks
+
+    Returns:
+        CrewComponents: New, unshared components
+    """
+    from app.core.agents import build_planner, build_researcher, build_writer, get_llm
+    from app.core.tasks import build_planning_task, build_research_task, build_writing_task
+
+    llm = get_llm()
+    researcher = build_researcher(llm)
+    planner = build_planner(llm)
+    writer = build_writer(get_llm(stream=settings.WRITER_STREAMING))
+
+    return CrewComponents(
+        agents={"researcher": researcher, "planner": planner, "writer": writer},
+        tasks={
+            "researcher": build_research_task(researcher),
+            "planner": build_planning_task(planner),
+            "writer": build_writing_task(writer)
+        }
+    )
+
+
+def build_topic_researcher() -> CrewComponents:
+    """
+    Build a fresh researcher and research task for one topic of a parallel run
+
+    Returns:
+        CrewComponents: Components holding only the researcher stage
+    """
+    from app.core.agents import build_researcher, get_llm
+    from app.core.tasks import build_research_task
+
+    researcher = build_researcher(get_llm())
+    return CrewComponents(
+        agents={"researcher": researcher},
+        tasks={"researcher": build_research_task(researcher)}
+    )
+
+
+def build_piece_writer() -> CrewComponents:
+    """
+    Build a fresh writer and writing task for one content type of a parallel run
+
+    Returns:
+        CrewComponents: Components holding only the writer stage
+    """
+    from app.core.agents import build_writer, get_llm
+    from app.core.tasks import build_writing_task
+
+    writer = build_writer(get_llm(stream=settings.WRITER_STREAMING))
+    return CrewComponents(
+        agents={"writer": writer},
+        tasks={"writer": build_writing_task(writer, with_content_plan=True)}
+    )
+
+
+class CrewTemplatePool:
+    """
+    Pool of pre-built crew components
+
+    Each component set is handed out once. A background thread rebuilds
+    taken sets, so runs normally get a ready-made set without paying the
+    construction cost on the request path.
+    """
+
+    def __init__(self, size: int):
+        """Initialize the pool (call warm_up to pre-build templates)"""
+        self.size = max(0, size)
+        self._templates: queue.Queue = queue.Queue(maxsize=self.size or 1)
+        self._refiller: Optional[ThreadPoolExecutor] = None
+        self._refill_pending = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def warm_up(self) -> None:
+        """Pre-build templates until the pool is full (blocking)"""
+        started_at = time.perf_counter()
+        self._fill()
+        logger.info(
+            f"Crew template pool warmed: {self._templates.qsize()} template(s) "
+            f"in {time.perf_counter() - started_at:.3f}s"
+        )
+
+    def acquire(self) -> CrewComponents:
+        """
+        Take a component set for a run
+
+        Returns:
+            CrewComponents: Pre-built set, or a freshly built one if the pool is empty
+        """
+        if self.size == 0:
+            return build_crew_components()
+
+        try:
+            components = self._templates.get_nowait()
+            self.hits += 1
+        except queue.Empty:
+            components = build_crew_components()
+            self.misses += 1
+            logger.debug("Crew template pool empty, built components on demand")
+
+        self._schedule_refill()
+        return components
+
+    def _schedule_refill(self) -> None:
+        """Refill the pool in the background (at most one refill at a time)"""
+        with self._lock:
+            if self._refill_pending:
+                return
+            if self._refiller is None:
+                self._refiller = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="crew-template-refill"
+                )
+            self._refill_pending = True
+            self._refiller.submit(self._refill)
+
+    def _refill(self) -> None:
+        """Background refill job"""
+        try:
+            self._fill()
+        except Exception as e:
+            logger.error(f"Crew template refill failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._refill_pending = False
+
+    def _fill(self) -> None:
+        """Build templates until the pool is full"""
+        while self._templates.qsize() < self.size:
+            try:
+                self._templates.put_nowait(build_crew_components())
+            except queue.Full:
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage
+
+        Returns:
+            Dict: Size, available templates, hits and misses
+        """
+        return {
+            "size": self.size,
+            "available": self._templates.qsize(),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def shutdown(self) -> None:
+        """Stop the background refill thread"""
+        with self._lock:
+            if self._refiller is not None:
+                self._refiller.shutdown(wait=False, cancel_futures=True)
+                self._refiller = None
+
+
+# Create pool instance
+crew_template_pool = CrewTemplatePool(settings.CREW_TEMPLATE_POOL_SIZE)
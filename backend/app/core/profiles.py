@@ -0,0 +1,103 @@
+"""
+Pipeline Profiles
+Named speed/depth trade-offs selectable per request
+"""
+
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+
+DEFAULT_PROFILE = "standard"
+
+
+class PipelineProfile:
+    """
+    How much work a crew run does, and how long it is expected to take
+
+    A profile selects the pipeline stages, the search depth and result
+    count, scales the per-stage tool call budgets and declares a latency
+    budget that each run is measured against.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        stages: Tuple[str, ...],
+        search_depth: str,
+        search_max_results: int,
+        tool_call_factor: float,
+        parallel_writers: bool,
+        latency_budget: float
+    ):
+        """
+        Initialize the profile
+
+        Args:
+            name: Profile name
+            stages: Pipeline stages, in execution order
+            search_depth: Tavily search depth ("basic" or "advanced")
+            search_max_results: Results requested per search
+            tool_call_factor: Multiplier applied to the per-stage tool call budgets
+            parallel_writers: Whether content types may be written concurrently
+            latency_budget: Expected maximum run duration in seconds
+        """
+        self.name = name
+        self.stages = stages
+        self.search_depth = search_depth
+        self.search_max_results = search_max_results
+        self.tool_call_factor = tool_call_factor
+        self.parallel_writers = parallel_writers
+        self.latency_budget = latency_budget
+
+
+PROFILES: Dict[str, PipelineProfile] = {
+    # Basic search, no planner and a single writer pass
+    "fast": PipelineProfile(
+        name="fast",
+        stages=("researcher", "writer"),
+        search_depth="basic",
+        search_max_results=settings.SEARCH_MAX_RESULTS,
+        tool_call_factor=0.5,
+        parallel_writers=False,
+        latency_budget=settings.FAST_PROFILE_LATENCY_BUDGET
+    ),
+    # The full researcher -> planner -> writer pipeline
+    "standard": PipelineProfile(
+        name="standard",
+        stages=("researcher", "planner", "writer"),
+        search_depth=settings.SEARCH_DEPTH,
+        search_max_results=settings.SEARCH_MAX_RESULTS,
+        tool_call_factor=1.0,
+        parallel_writers=True,
+        latency_budget=settings.STANDARD_PROFILE_LATENCY_BUDGET
+    ),
+    # Full pipeline with more results per search and more searches
+    "deep": PipelineProfile(
+        name="deep",
+        stages=("researcher", "planner", "writer"),
+        search_depth="advanced",
+        search_max_results=settings.DEEP_PROFILE_SEARCH_MAX_RESULTS,
+        tool_call_factor=1.5,
+        parallel_writers=True,
+        latency_budget=settings.DEEP_PROFILE_LATENCY_BUDGET
+    )
+}
+
+
+def get_profile(name: Optional[str] = None) -> PipelineProfile:
+    """
+    Look up a pipeline profile
+
+    Args:
+        name: Profile name (defaults to "standard")
+
+    Returns:
+        PipelineProfile: The profile
+
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    profile = PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        raise ValueError(f"Unknown pipeline profile: {name}")
+    return profile
@@ -0,0 +1,43 @@
+"""
+Research Cache
+Stores research reports as reusable artifacts across requests
+"""
+
+from typing import Any, Dict
+
+from app.config import settings
+from app.core.profiles import PipelineProfile
+from app.utils.cache import TTLCache, cache_store, make_cache_key
+from app.utils.helpers import normalize_text
+
+research_cache = TTLCache(
+    namespace="research",
+    ttl=settings.RESEARCH_CACHE_TTL,
+    max_entries=settings.RESEARCH_CACHE_MAX_ENTRIES,
+    disk_store=cache_store,
+    max_disk_entries=settings.RESEARCH_CACHE_MAX_DISK_ENTRIES
+)
+
+
+def research_cache_key(inputs: Dict[str, Any], profile: PipelineProfile) -> str:
+    """
+    Build the cache key of a research report
+
+    Research depends only on the topics, audience and goals, so briefs
+    that differ in voice, content types or timeline share a report.
+
+    Args:
+        inputs: Crew inputs
+        profile: Pipeline profile (its search options shape the research)
+
+    Returns:
+        str: Cache key
+    """
+    return make_cache_key(
+        [normalize_text(topic) for topic in inputs.get("content_topics", [])],
+        normalize_text(inputs.get("target_audience")),
+        normalize_text(inputs.get("business_goals")),
+        settings.LLM_MODEL,
+        profile.search_depth,
+        profile.search_max_results
+    )
@@ -0,0 +1,243 @@
+"""
+Run Context
+Per-run state shared by the crew, its callbacks and its tools
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from app.core.profiles import PipelineProfile, get_profile
+from app.utils.logger import setup_logger
+from app.utils.metrics import STAGE_DURATION
+
+logger = setup_logger(__name__)
+
+# Receives progress events; must be cheap and thread-safe
+EventSink = Callable[[Dict[str, Any]], None]
+
+_current_run: ContextVar[Optional["RunContext"]] = ContextVar("current_run", default=None)
+
+
+class RunContext:
+    """
+    State of a single crew run
+
+    Tracks which pipeline stage is active and emits progress events
+    (each stamped with the elapsed run time) to an optional sink. It also
+    holds the run's pipeline profile, search memo and per-stage tool call budgets.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[EventSink] = None,
+        tool_call_limits: Optional[Dict[str, int]] = None,
+        profile: Optional[PipelineProfile] = None
+    ):
+        """
+        Initialize the run context
+
+        Args:
+            sink: Optional callable receiving progress events
+            tool_call_limits: Maximum tool calls per stage (unlisted stages are unlimited)
+            profile: Pipeline profile of the run (defaults to "standard")
+        """
+        self.sink = sink
+        self.tool_call_limits = tool_call_limits or {}
+        self.profile = profile or get_profile()
+        self.started_at = time.perf_counter()
+        self.stages: List[str] = []
+        self.current_stage: Optional[str] = None
+        self._stage_index = 0
+        self._stage_started_at = self.started_at
+        self._lock = threading.Lock()
+        self._search_memo: Dict[str, Any] = {}
+        self.stage_durations: Dict[str, float] = {}
+        self.tool_calls: Dict[str, int] = {}
+        self.rejected_tool_calls: Dict[str, int] = {}
+        self.searches = 0
+        self.memo_hits = 0
+
+    def elapsed(self) -> float:
+        """Seconds since the run started"""
+        return round(time.perf_counter() - self.started_at, 3)
+
+    def emit(self, event: str, **data: Any) -> None:
+        """
+        Emit a progress event
+
+        Args:
+            event: Event name (e.g. task_started, tool_call)
+            **data: Extra event fields
+        """
+        if self.sink is None:
+            return
+        payload = {"event": event, "stage": self.current_stage, "elapsed": self.elapsed()}
+        payload.update(data)
+        try:
+            self.sink(payload)
+        except Exception as e:
+            # Progress reporting must never break the run itself
+            logger.warning(f"Dropping progress event '{event}': {str(e)}")
+
+    def start(self, stages: Sequence[str]) -> None:
+        """
+        Mark the run as started and enter the first stage
+
+        Args:
+            stages: Stage names in execution order
+        """
+        self.stages = list(stages)
+        self._stage_index = 0
+        self.emit("run_started", stages=self.stages)
+        self._enter_stage()
+
+    def complete_stage(self, **data: Any) -> None:
+        """
+        Mark the current stage as completed and enter the next one
+
+        Args:
+            **data: Extra fields for the task_completed event
+        """
+        duration = round(time.perf_counter() - self._stage_started_at, 3)
+        if self.current_stage is not None:
+            self.stage_durations[self.current_stage] = duration
+            STAGE_DURATION.labels(stage=self.current_stage, profile=self.profile.name).observe(duration)
+        self.emit("task_completed", duration=duration, **data)
+        self._stage_index += 1
+        self._enter_stage()
+
+    def finish(self) -> None:
+        """Mark the run as completed"""
+        self.current_stage = None
+        if self.over_budget():
+            logger.warning(
+                f"Run took {self.elapsed()}s, over the {self.profile.latency_budget}s "
+                f"budget of the '{self.profile.name}' profile"
+            )
+        self.emit("run_completed", stats=self.stats())
+
+    def over_budget(self) -> bool:
+        """Whether the run has exceeded its profile's latency budget"""
+        return self.elapsed() > self.profile.latency_budget
+
+    def allow_tool_call(self) -> bool:
+        """
+        Count a tool call against the current stage's budget
+
+        Returns:
+            bool: False if the stage has used up its tool calls
+        """
+        return self.reserve_tool_calls(1) == 1
+
+    def reserve_tool_calls(self, requested: int) -> int:
+        """
+        Count up to `requested` tool calls against the current stage's budget
+
+        Used by tools that do several calls' worth of work at once (e.g. one
+        search per query), so batching cannot get around the budget.
+
+        Args:
+            requested: Number of calls wanted
+
+        Returns:
+            int: Number of calls granted (0 if the stage has used up its tool calls)
+        """
+        stage = self.current_stage or "unknown"
+        limit = self.tool_call_limits.get(stage)
+        with self._lock:
+            used = self.tool_calls.get(stage, 0)
+            granted = requested if limit is None else max(0, min(requested, limit - used))
+            if granted < requested:
+                self.rejected_tool_calls[stage] = self.rejected_tool_calls.get(stage, 0) + requested - granted
+            if granted:
+                self.tool_calls[stage] = used + granted
+            return granted
+
+    def recall_search(self, key: str) -> Optional[Any]:
+        """
+        Get results of a search already made in this run
+
+        Args:
+            key: Normalized query key
+
+        Returns:
+            Optional[Any]: Memoized results, or None
+        """
+        with self._lock:
+            results = self._search_memo.get(key)
+            if results is not None:
+                self.memo_hits += 1
+            return results
+
+    def remember_search(self, key: str, results: Any) -> None:
+        """
+        Memoize search results for the rest of the run
+
+        Args:
+            key: Normalized query key
+            results: Search results
+        """
+        with self._lock:
+            self._search_memo[key] = results
+            self.searches += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get run counters
+
+        Returns:
+            Dict: Profile and latency budget, duration, per-stage durations
+                and tool calls, searches and memo hits
+        """
+        with self._lock:
+            return {
+                "profile": self.profile.name,
+                "latency_budget": self.profile.latency_budget,
+                "over_budget": self.over_budget(),
+                "duration": self.elapsed(),
+                "stage_durations": dict(self.stage_durations),
+                "tool_calls": dict(self.tool_calls),
+                "rejected_tool_calls": dict(self.rejected_tool_calls),
+                "searches": self.searches,
+                "memo_hits": self.memo_hits
+            }
+
+    def _enter_stage(self) -> None:
+        """Enter the stage at the current index (if any remain)"""
+        if self._stage_index >= len(self.stages):
+            self.current_stage = None
+            return
+        self.current_stage = self.stages[self._stage_index]
+        self._stage_started_at = time.perf_counter()
+        self.emit("task_started")
+
+
+def get_current_run() -> Optional[RunContext]:
+    """
+    Get the run context of the crew run executing in this context
+
+    Returns:
+        Optional[RunContext]: Active run, or None outside a run
+    """
+    return _current_run.get()
+
+
+@contextmanager
+def activate_run(run: RunContext) -> Iterator[RunContext]:
+    """
+    Make a run context current for the duration of a crew run
+
+    Args:
+        run: Run context to activate
+
+    Yields:
+        RunContext: The activated run
+    """
+    token = _current_run.set(run)
+    try:
+        yield run
+    finally:
+        _current_run.reset(token)
@@ -0,0 +1,265 @@
+"""
+Search Client
+Pooled, cached and concurrent Tavily web search
+"""
+
+import contextvars
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import settings
+from app.core.run_context import get_current_run
+from app.utils.cache import TTLCache, cache_store, make_cache_key
+from app.utils.logger import setup_logger
+from app.utils.metrics import SEARCH_DURATION, timed
+
+if TYPE_CHECKING:
+    from tavily import TavilyClient
+
+logger = setup_logger(__name__)
+
+# Words ignored when matching near-repeat queries within a run
+MEMO_STOPWORDS = frozenset({
+    "a", "an", "and", "the", "of", "for", "in", "on", "to", "with", "about",
+    "what", "are", "is", "how", "best", "latest", "top"
+})
+
+# Shared across requests: the same trending query is often searched repeatedly
+search_cache = TTLCache(
+    namespace="search",
+    ttl=settings.SEARCH_CACHE_TTL,
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    disk_store=cache_store,
+    max_disk_entries=settings.SEARCH_CACHE_MAX_DISK_ENTRIES
+)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query for cache lookups
+
+    Args:
+        query: Raw query
+
+    Returns:
+        str: Lower-cased query with collapsed whitespace
+    """
+    return " ".join(query.lower().split())
+
+
+def memo_key(query: str) -> str:
+    """
+    Build a run-memo key that also matches near-repeat queries
+
+    Word order, punctuation and filler words are ignored, so
+    "latest AI trends 2025" and "AI trends in 2025" share a key.
+
+    Args:
+        query: Raw query
+
+    Returns:
+        str: Memo key
+    """
+    words = set(re.findall(r"[a-z0-9]+", query.lower())) - MEMO_STOPWORDS
+    return " ".join(sorted(words)) or normalize_query(query)
+
+
+def search_cache_key(query: str, search_depth: str, max_results: int) -> str:
+    """
+    Build the cache key for a query under the given search options
+
+    Args:
+        query: Raw query
+        search_depth: Tavily search depth
+        max_results: Number of results requested
+
+    Returns:
+        str: Cache key
+    """
+    return make_cache_key(normalize_query(query), search_depth, max_results)
+
+
+class SearchClient:
+    """
+    Process-wide Tavily search client
+
+    One TavilyClient with a keep-alive connection pool is shared by all
+    searches, and batches of queries run concurrently. At most
+    `max_concurrency` Tavily requests are in flight process-wide, whether
+    they come from single searches or batches, and from one crew or many:
+    requests beyond the cap wait for a slot (and a pooled connection)
+    instead of opening extra connections.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """Initialize the client (connections and workers are created lazily)"""
+        self.max_concurrency = max(1, max_concurrency)
+        self._client: Optional["TavilyClient"] = None
+        self._workers: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    def _get_client(self) -> "TavilyClient":
+        """
+        Create the pooled Tavily client on first use
+
+        Raises:
+            RuntimeError: If TAVILY_API_KEY is not configured
+        """
+        with self._lock:
+            if self._client is None:
+                if not settings.TAVILY_API_KEY:
+                    raise RuntimeError("TAVILY_API_KEY is not configured")
+                from tavily import TavilyClient
+
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.max_concurrency,
+                    pool_block=True
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._client = TavilyClient(
+                    api_key=settings.TAVILY_API_KEY,
+                    api_base_url=settings.TAVILY_API_URL,
+                    session=session
+                )
+            return self._client
+
+    def _get_workers(self) -> ThreadPoolExecutor:
+        """Create the search worker pool on first use"""
+        with self._lock:
+            if self._workers is None:
+                self._workers = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="search-worker"
+                )
+            return self._workers
+
+    def search(self, query: str) -> Dict[str, Any]:
+        """
+        Search the web for a single query (served from cache when possible)
+
+        Args:
+            query: Search query
+
+        Returns:
+            Dict: Tavily search response
+
+        Raises:
+            Exception: If the Tavily request fails
+        """
+        run = get_current_run()
+        with timed(SEARCH_DURATION, source="error") as timer:
+            try:
+                if run is not None:
+                    results = run.recall_search(memo_key(query))
+                    if results is not None:
+                        timer.labels["source"] = "memo"
+                        logger.info(f"Search memo hit for query: {query}")
+                        run.emit(
+                            "search_finished",
+                            query=query,
+                            memo=True,
+                            results=len(results.get("results", [])),
+                            duration=round(timer.elapsed(), 3)
+                        )
+                        return results
+
+                # The run's profile decides how deep and wide each search goes
+                if run is not None:
+                    search_depth = run.profile.search_depth
+                    max_results = run.profile.search_max_results
+                else:
+                    search_depth = settings.SEARCH_DEPTH
+                    max_results = settings.SEARCH_MAX_RESULTS
+
+                cache_key = search_cache_key(query, search_depth, max_results)
+                results = search_cache.get(cache_key) if settings.SEARCH_CACHE_ENABLED else None
+                cached = results is not None
+                timer.labels["source"] = "cache" if cached else "tavily"
+
+                if cached:
+                    logger.info(f"Search cache hit for query: {query}")
+                else:
+                    logger.info(f"Performing search for query: {query}")
+                    client = self._get_client()
+                    # Cache and memo hits never wait, only Tavily requests take a slot
+                    with self._slots:
+                        results = client.search(
+                            query=query,
+                            max_results=max_results,
+                            search_depth=search_depth
+                        )
+                    if settings.SEARCH_CACHE_ENABLED:
+                        search_cache.set(cache_key, results)
+                    logger.info(f"Search completed successfully for query: {query}")
+
+                if run is not None:
+                    run.remember_search(memo_key(query), results)
+                    run.emit(
+                        "search_finished",
+                        query=query,
+                        cached=cached,
+                        results=len(results.get("results", [])),
+                        duration=round(timer.elapsed(), 3)
+                    )
+                return results
+
+            except Exception as e:
+                timer.labels["source"] = "error"
+                if run is not None:
+                    run.emit(
+                        "search_finished",
+                        query=query,
+                        error=str(e),
+                        duration=round(timer.elapsed(), 3)
+                    )
+                raise
+
+    def search_many(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """
+        Search several queries concurrently
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            List[Dict]: One entry per query, in query order, with either
+                `results` (the Tavily response) or `error`
+        """
+        workers = self._get_workers()
+        # Each search runs in a copy of this context so it still sees the current run
+        futures = [
+            workers.submit(contextvars.copy_context().run, self.search, query)
+            for query in queries
+        ]
+
+        outcomes = []
+        for query, future in zip(queries, futures):
+            try:
+                outcomes.append({"query": query, "results": future.result()})
+            except Exception as e:
+                logger.error(f"Search failed for query '{query}': {str(e)}")
+                outcomes.append({"query": query, "error": str(e)})
+        return outcomes
+
+    def close(self) -> None:
+        """Close pooled connections and stop the search workers"""
+        with self._lock:
+            if self._workers is not None:
+                self._workers.shutdown(wait=False, cancel_futures=True)
+                self._workers = None
+            if self._client is not None:
+                self._client.session.close()
+                self._client = None
+
+
+# Create client instance
+search_client = SearchClient(settings.SEARCH_MAX_CONCURRENCY)
@@ -0,0 +1,170 @@
+"""
+Search Digest
+Compacts raw Tavily responses into token-budgeted text for agent prompts
+"""
+
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from app.config import settings
+
+# Rough characters-per-token ratio used for budgeting
+CHARS_PER_TOKEN = 4
+
+# Longest query and error text shown on a query line
+QUERY_MAX_CHARS = 150
+ERROR_MAX_CHARS = 200
+
+# Answers shorter than this are dropped rather than cut down further
+MIN_ANSWER_CHARS = 80
+
+# Kept free for the closing "... omitted" note
+NOTE_RESERVE_CHARS = 64
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text
+
+    Args:
+        text: Input text
+
+    Returns:
+        int: Approximate number of tokens
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for duplicate detection
+
+    Args:
+        url: Result URL
+
+    Returns:
+        str: URL without fragment, trailing slash or host case differences
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def trim_snippet(text: str, max_chars: int) -> str:
+    """
+    Collapse whitespace and cut a snippet at a word boundary
+
+    Args:
+        text: Result content
+        max_chars: Maximum snippet length
+
+    Returns:
+        str: Trimmed snippet
+    """
+    text = " ".join((text or "").split())
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return cut.rstrip(",;:") + "..."
+
+
+def compact_results(
+    outcomes: List[Dict[str, Any]],
+    token_budget: Optional[int] = None,
+    snippet_chars: Optional[int] = None
+) -> str:
+    """
+    Build a compact digest of search results
+
+    Every line counts against the token budget, which is filled in order:
+    one line per query (what was searched, or why it failed), Tavily's
+    answers (shortened, or dropped when little room is left), then results
+    from all queries, deduplicated by URL and ranked by score (title, URL,
+    trimmed snippet). Room is always kept for the closing note.
+
+    Args:
+        outcomes: One entry per query with `query` and either `results`
+            (a Tavily response) or `error`
+        token_budget: Maximum digest size in tokens (defaults to settings)
+        snippet_chars: Maximum characters per snippet (defaults to settings)
+
+    Returns:
+        str: Digest text
+    """
+    budget_chars = (token_budget or settings.SEARCH_DIGEST_TOKEN_BUDGET) * CHARS_PER_TOKEN
+    snippet_chars = snippet_chars or settings.SEARCH_SNIPPET_MAX_CHARS
+
+    blocks = []
+    candidates = []
+    seen_urls = set()
+    failures = 0
+    for outcome in outcomes:
+        query = trim_snippet(outcome.get("query", ""), QUERY_MAX_CHARS)
+        if "error" in outcome:
+            error = trim_snippet(str(outcome["error"]), ERROR_MAX_CHARS)
+            blocks.append((f'Search for "{query}" failed: {error}', None))
+            failures += 1
+            continue
+
+        response = outcome.get("results") or {}
+        blocks.append((f'Searched: "{query}"', response.get("answer") or None))
+
+        for result in response.get("results", []):
+            url = result.get("url", "")
+            key = normalize_url(url)
+            if not url or key in seen_urls:
+                continue
+            seen_urls.add(key)
+            candidates.append(result)
+
+    candidates.sort(key=lambda result: result.get("score") or 0, reverse=True)
+
+    used = NOTE_RESERVE_CHARS
+    kept_blocks = []
+    for header, answer in blocks:
+        if used + len(header) + 1 > budget_chars:
+            break
+        kept_blocks.append([header, answer])
+        used += len(header) + 1
+    omitted_queries = len(blocks) - len(kept_blocks)
+
+    # Answers share at most a third of the room left, so results still fit
+    answered = [block for block in kept_blocks if block[1]]
+    if answered:
+        share = (budget_chars - used) // 3 // len(answered)
+        answer_chars = min(snippet_chars, share - len("Answer: ...") - 1)
+        for block in answered:
+            if answer_chars < MIN_ANSWER_CHARS:
+                block[1] = None
+                continue
+            block[1] = f"Answer: {trim_snippet(block[1], answer_chars)}"
+            used += len(block[1]) + 1
+
+    lines = []
+    for header, answer in kept_blocks:
+        lines.append(header)
+        if answer:
+            lines.append(answer)
+
+    included = 0
+    for result in candidates:
+        entry = (
+            f"{included + 1}. {result.get('title') or 'Untitled'} ({result['url']})\n"
+            f"   {trim_snippet(result.get('content', ''), snippet_chars)}"
+        )
+        if used + len(entry) + 1 > budget_chars:
+            break
+        lines.append(entry)
+        used += len(entry) + 1
+        included += 1
+
+    omitted = []
+    if included < len(candidates):
+        omitted.append(f"{len(candidates) - included} lower-ranked result(s)")
+    if omitted_queries:
+        omitted.append(f"{omitted_queries} query line(s)")
+    if omitted:
+        lines.append(f"({' and '.join(omitted)} omitted)")
+    elif not candidates and failures < len(outcomes):
+        lines.append("No results found.")
+    return "\n".join(lines)
@@ -3,31 +3,75 @@ AI Tools Configuration
 Search and other tools used by AI agents
 """
 
+from typing import List
 from crewai.tools import tool
-from tavily import TavilyClient
 from app.config import settings
+from app.core.run_context import get_current_run
+from app.core.search_client import search_client
+from app.core.search_digest import compact_results
 from app.utils.logger import setup_logger
+from app.utils.metrics import TOOL_CALL_DURATION, timed
 
 logger = setup_logger(__name__)
 
+# Returned instead of results once a stage has used its tool call budget
+TOOL_BUDGET_EXHAUSTED = (
+    "Tool call budget for this task is used up. "
+    "Do not search again; complete the task with the information you already have."
+)
+
 class SearchTools:
     @tool("Search")
     def search(query: str):
         """Search the web for latest high demanding content, trends, and information about topics.
         Useful for finding current events, market trends, and specific information."""
-        try:
-            logger.info(f"Performing search for query: {query}")
-            client = TavilyClient(api_key=settings.TAVILY_API_KEY)
-            results = client.search(
-                query=query,
-                max_results=settings.SEARCH_MAX_RESULTS,
-                search_depth=settings.SEARCH_DEPTH
-            )
-            logger.info(f"Search completed successfully for query: {query}")
-            return str(results)
-        except Exception as e:
-            logger.error(f"Search failed for query '{query}': {str(e)}")
-            return f"Search failed: {str(e)}"
+        with timed(TOOL_CALL_DURATION, tool="Search", outcome="ok") as timer:
+            run = get_current_run()
+            if run is not None:
+                if not run.allow_tool_call():
+                    timer.labels["outcome"] = "rejected"
+                    run.emit("tool_call_rejected", tool="Search", query=query)
+                    return TOOL_BUDGET_EXHAUSTED
+                run.emit("tool_call", tool="Search", query=query)
+            try:
+                results = search_client.search(query)
+                return compact_results([{"query": query, "results": results}])
+            except Exception as e:
+                timer.labels["outcome"] = "error"
+                logger.error(f"Search failed for query '{query}': {str(e)}")
+                return f"Search failed: {str(e)}"
+
+    @tool("Multi Search")
+    def multi_search(queries: List[str]):
+        """Search the web for a few queries at once, e.g. different angles on a topic.
+        Faster than calling Search repeatedly; results are returned in the same order as the queries.
+        Each query counts as one search against your budget, and only the first few queries of a call are searched."""
+        with timed(TOOL_CALL_DURATION, tool="Multi Search", outcome="ok") as timer:
+            if not queries:
+                timer.labels["outcome"] = "rejected"
+                return "No queries given."
+            requested = list(queries)[:settings.MULTI_SEARCH_MAX_QUERIES]
+            run = get_current_run()
+            if run is not None:
+                # Every query costs one tool call; queries past the budget are dropped
+                granted = run.reserve_tool_calls(len(requested))
+                if len(requested) < len(queries) or granted < len(requested):
+                    run.emit(
+                        "tool_call_rejected",
+                        tool="Multi Search",
+                        queries=list(queries)[granted:]
+                    )
+                if not granted:
+                    timer.labels["outcome"] = "rejected"
+                    return TOOL_BUDGET_EXHAUSTED
+                requested = requested[:granted]
+                run.emit("tool_call", tool="Multi Search", queries=requested)
+            digest = compact_results(search_client.search_many(requested))
+            skipped = len(queries) - len(requested)
+            if skipped:
+                digest += f"\n({skipped} of {len(queries)} queries not searched: over the per-call limit or search budget)"
+            return digest
 
-# Export the tool instance
+# Export the tool instances
 search_tool = SearchTools.search
+multi_search_tool = SearchTools.multi_search
@@ -0,0 +1,3 @@
+"""
+Persistence Package
+"""
@@ -0,0 +1,92 @@
+"""
+SQLite Store Base
+Shared connection handling for the local SQLite-backed stores
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Sequence
+
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Backend folder, used to anchor relative store paths
+BACKEND_DIR = Path(__file__).parent.parent.parent
+
+
+def resolve_data_path(path: str) -> str:
+    """
+    Resolve a store path relative to the backend folder
+
+    Args:
+        path: Absolute path, relative path or ":memory:"
+
+    Returns:
+        str: Path usable by sqlite3.connect
+    """
+    if path == ":memory:":
+        return path
+
+    resolved = Path(path)
+    if not resolved.is_absolute():
+        resolved = BACKEND_DIR / resolved
+    resolved.parent.mkdir(parents=True, exist_ok=True)
+    return str(resolved)
+
+
+class SQLiteStore:
+    """
+    Thread-safe wrapper around a single SQLite connection
+
+    Subclasses set SCHEMA; it is applied once when the connection is opened.
+    """
+
+    SCHEMA: str = ""
+
+    def __init__(self, path: str):
+        """Remember the database path (the connection is opened on first use)"""
+        self.path = resolve_data_path(path)
+        self._conn: sqlite3.Connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and apply the schema"""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            if self.path != ":memory:":
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            if self.SCHEMA:
+                conn.executescript(self.SCHEMA)
+            conn.commit()
+            self._conn = conn
+            logger.info(f"{type(self).__name__} opened at: {self.path}")
+        return self._conn
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """
+        Execute a statement and commit
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            List[sqlite3.Row]: Fetched rows (empty for writes)
+        """
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(sql, params)
+            rows = cursor.fetchall()
+            conn.commit()
+            return rows
+
+    def close(self) -> None:
+        """Close the connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,126 @@
+"""
+Job Store
+Persists asynchronous content generation jobs in SQLite
+"""
+
+import json
+import uuid
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.db.base import SQLiteStore
+from app.utils.helpers import format_timestamp
+
+# Job lifecycle states
+JOB_PENDING = "pending"
+JOB_PROCESSING = "processing"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class JobStore(SQLiteStore):
+    """
+    SQLite-backed store for generation jobs
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        task_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        request TEXT NOT NULL,
+        result TEXT,
+        error TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+    """
+
+    def create(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a new pending job
+
+        Args:
+            request_data: Content generation parameters
+
+        Returns:
+            Dict: Stored job
+        """
+        task_id = uuid.uuid4().hex
+        now = format_timestamp()
+        self.execute(
+            "INSERT INTO jobs (task_id, status, request, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (task_id, JOB_PENDING, json.dumps(request_data), now, now)
+        )
+        return self.get(task_id)
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job by id
+
+        Args:
+            task_id: Job identifier
+
+        Returns:
+            Optional[Dict]: Job, or None if unknown
+        """
+        rows = self.execute("SELECT * FROM jobs WHERE task_id = ?", (task_id,))
+        return self._to_dict(rows[0]) if rows else None
+
+    def list_unfinished(self) -> List[Dict[str, Any]]:
+        """
+        Get all jobs that are still pending or were processing
+
+        Returns:
+            List[Dict]: Unfinished jobs, oldest first
+        """
+        rows = self.execute(
+            "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+            (JOB_PENDING, JOB_PROCESSING)
+        )
+        return [self._to_dict(row) for row in rows]
+
+    def update_status(
+        self,
+        task_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Update the status (and optionally result or error) of a job
+
+        Args:
+            task_id: Job identifier
+            status: New job status
+            result: Job result if completed
+            error: Error message if failed
+        """
+        self.execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE task_id = ?",
+            (
+                status,
+                json.dumps(result) if result is not None else None,
+                error,
+                format_timestamp(),
+                task_id
+            )
+        )
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        """Convert a database row into a job dict"""
+        return {
+            "task_id": row["task_id"],
+            "status": row["status"],
+            "request": json.loads(row["request"]),
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"]
+        }
+
+
+# Create store instance
+job_store = JobStore(settings.JOB_STORE_PATH)
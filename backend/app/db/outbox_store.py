@@ -0,0 +1,312 @@
+"""
+Outbox Store
+Persists queued emails and their delivery attempts in SQLite
+"""
+
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.db.base import SQLiteStore
+from app.utils.helpers import format_timestamp
+
+# Email lifecycle states
+EMAIL_QUEUED = "queued"
+EMAIL_SENDING = "sending"
+EMAIL_SENT = "sent"
+EMAIL_FAILED = "failed"
+
+
+class OutboxStore(SQLiteStore):
+    """
+    SQLite-backed store for outgoing emails
+
+    `next_attempt_at` is a Unix timestamp; queued emails become due once
+    it has passed, which is how retry backoff is persisted.
+
+    Bulk sends store their rendered bodies once in `email_batches`; the
+    payload of each member email only references the batch.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS emails (
+        email_id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        recipient TEXT NOT NULL,
+        subject TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        next_attempt_at REAL NOT NULL,
+        last_error TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        sent_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_emails_due ON emails (status, next_attempt_at);
+    CREATE TABLE IF NOT EXISTS email_batches (
+        batch_id TEXT PRIMARY KEY,
+        subject TEXT NOT NULL,
+        html_body TEXT NOT NULL,
+        text_body TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS email_batch_members (
+        email_id TEXT PRIMARY KEY,
+        batch_id TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_batch_members ON email_batch_members (batch_id);
+    """
+
+    def create(self, recipient: str, subject: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a new email for immediate delivery
+
+        Args:
+            recipient: Recipient email address
+            subject: Email subject
+            payload: Body fields (content, topics, content_types)
+
+        Returns:
+            Dict: Stored email
+        """
+        email_id = uuid.uuid4().hex
+        now = format_timestamp()
+        self.execute(
+            "INSERT INTO emails (email_id, status, recipient, subject, payload, next_attempt_at, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (email_id, EMAIL_QUEUED, recipient, subject, json.dumps(payload), time.time(), now, now)
+        )
+        return self.get(email_id)
+
+    def create_batch(
+        self,
+        recipients: List[str],
+        subject: str,
+        html_body: str,
+        text_body: str
+    ) -> Dict[str, Any]:
+        """
+        Store rendered bodies once and queue one email per recipient
+
+        The batch and all of its emails are written in one transaction.
+
+        Args:
+            recipients: Recipient email addresses
+            subject: Email subject
+            html_body: Rendered HTML body
+            text_body: Rendered plain text body
+
+        Returns:
+            Dict: Batch id, creation time and the queued emails
+        """
+        batch_id = uuid.uuid4().hex
+        now = format_timestamp()
+        due = time.time()
+        payload = json.dumps({"batch_id": batch_id})
+        email_ids = [uuid.uuid4().hex for _ in recipients]
+
+        # One transaction, so a failure never leaves a partly queued batch
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO email_batches (batch_id, subject, html_body, text_body, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (batch_id, subject, html_body, text_body, now)
+                )
+                conn.executemany(
+                    "INSERT INTO email_batch_members (email_id, batch_id) VALUES (?, ?)",
+                    [(email_id, batch_id) for email_id in email_ids]
+                )
+                conn.executemany(
+                    "INSERT INTO emails (email_id, status, recipient, subject, payload, next_attempt_at, "
+                    "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (email_id, EMAIL_QUEUED, recipient, subject, payload, due, now, now)
+                        for email_id, recipient in zip(email_ids, recipients)
+                    ]
+                )
+        return {
+            "batch_id": batch_id,
+            "created_at": now,
+            "emails": [
+                {"email_id": email_id, "recipient_email": recipient, "status": EMAIL_QUEUED}
+                for email_id, recipient in zip(email_ids, recipients)
+            ]
+        }
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a batch's subject and rendered bodies
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Optional[Dict]: Batch, or None if unknown
+        """
+        rows = self.execute("SELECT * FROM email_batches WHERE batch_id = ?", (batch_id,))
+        return dict(rows[0]) if rows else None
+
+    def list_batch_emails(self, batch_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the emails of a batch in the order they were queued
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            List[Dict]: Member emails
+        """
+        rows = self.execute(
+            "SELECT emails.* FROM email_batch_members AS members "
+            "JOIN emails ON emails.email_id = members.email_id "
+            "WHERE members.batch_id = ? ORDER BY members.rowid",
+            (batch_id,)
+        )
+        return [self._to_dict(row) for row in rows]
+
+    def get(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an email by id
+
+        Args:
+            email_id: Email identifier
+
+        Returns:
+            Optional[Dict]: Email, or None if unknown
+        """
+        rows = self.execute("SELECT * FROM emails WHERE email_id = ?", (email_id,))
+        return self._to_dict(rows[0]) if rows else None
+
+    def claim_due(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Mark the oldest due emails as sending and return them
+
+        Only one dispatcher claims emails, so the select and update do
+        not need to be a single statement.
+
+        Args:
+            limit: Maximum number of emails to claim
+
+        Returns:
+            List[Dict]: Claimed emails
+        """
+        rows = self.execute(
+            "SELECT * FROM emails WHERE status = ? AND next_attempt_at <= ? "
+            "ORDER BY next_attempt_at LIMIT ?",
+            (EMAIL_QUEUED, time.time(), limit)
+        )
+        emails = [self._to_dict(row) for row in rows]
+        for email in emails:
+            self.execute(
+                "UPDATE emails SET status = ?, updated_at = ? WHERE email_id = ?",
+                (EMAIL_SENDING, format_timestamp(), email["email_id"])
+            )
+            email["status"] = EMAIL_SENDING
+        return emails
+
+    def next_due_at(self) -> Optional[float]:
+        """
+        Get when the next queued email becomes due
+
+        Returns:
+            Optional[float]: Unix timestamp, or None if nothing is queued
+        """
+        rows = self.execute(
+            "SELECT MIN(next_attempt_at) AS due FROM emails WHERE status = ?",
+            (EMAIL_QUEUED,)
+        )
+        return rows[0]["due"]
+
+    def mark_sent(self, email_id: str, attempts: int) -> None:
+        """
+        Record a successful delivery
+
+        Args:
+            email_id: Email identifier
+            attempts: Attempts made, including this one
+        """
+        now = format_timestamp()
+        self.execute(
+            "UPDATE emails SET status = ?, attempts = ?, last_error = NULL, updated_at = ?, "
+            "sent_at = ? WHERE email_id = ?",
+            (EMAIL_SENT, attempts, now, now, email_id)
+        )
+
+    def mark_retry(self, email_id: str, attempts: int, delay: float, error: str) -> None:
+        """
+        Record a failed attempt and queue the email again after a delay
+
+        Args:
+            email_id: Email identifier
+            attempts: Attempts made so far
+            delay: Seconds until the next attempt
+            error: Error of the failed attempt
+        """
+        self.execute(
+            "UPDATE emails SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, "
+            "updated_at = ? WHERE email_id = ?",
+            (EMAIL_QUEUED, attempts, time.time() + delay, error, format_timestamp(), email_id)
+        )
+
+    def mark_failed(self, email_id: str, attempts: int, error: str) -> None:
+        """
+        Record that an email will not be retried
+
+        Args:
+            email_id: Email identifier
+            attempts: Attempts made
+            error: Error of the last attempt
+        """
+        self.execute(
+            "UPDATE emails SET status = ?, attempts = ?, last_error = ?, updated_at = ? "
+            "WHERE email_id = ?",
+            (EMAIL_FAILED, attempts, error, format_timestamp(), email_id)
+        )
+
+    def requeue_interrupted(self) -> int:
+        """
+        Queue emails left sending by a previous process again
+
+        Returns:
+            int: Number of requeued emails
+        """
+        rows = self.execute("SELECT COUNT(*) AS n FROM emails WHERE status = ?", (EMAIL_SENDING,))
+        self.execute(
+            "UPDATE emails SET status = ?, updated_at = ? WHERE status = ?",
+            (EMAIL_QUEUED, format_timestamp(), EMAIL_SENDING)
+        )
+        return rows[0]["n"]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Count emails per status
+
+        Returns:
+            Dict: Number of emails by status
+        """
+        rows = self.execute("SELECT status, COUNT(*) AS n FROM emails GROUP BY status")
+        return {row["status"]: row["n"] for row in rows}
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        """Convert a database row into an email dict"""
+        return {
+            "email_id": row["email_id"],
+            "status": row["status"],
+            "recipient_email": row["recipient"],
+            "subject": row["subject"],
+            "payload": json.loads(row["payload"]),
+            "attempts": row["attempts"],
+            "last_error": row["last_error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+            "sent_at": row["sent_at"]
+        }
+
+
+# Create store instance
+outbox_store = OutboxStore(settings.EMAIL_OUTBOX_PATH)
@@ -3,13 +3,23 @@ FastAPI Main Application
 Entry point for the ContentPilot AI backend API
 """
 
-from fastapi import FastAPI, Request, status
+# Imported first so the startup clock covers the remaining imports
+from app.utils.startup import startup_tracker
+
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.api.v1.routes import api_router
 from app.config import settings
+from app.core.executor import crew_executor
+from app.core.factory import crew_template_pool
+from app.core.search_client import search_client
 from app.models.requests import HealthCheckResponse
+from app.services.email_service import email_service
+from app.services.job_service import job_service
+from app.services.outbox_service import email_outbox
 from app.utils.logger import setup_logger
+from app.utils.metrics import CONTENT_TYPE_LATEST, REQUEST_LATENCY, render_metrics, timed
 from datetime import datetime
 
 logger = setup_logger(__name__)
@@ -55,6 +65,21 @@ app.add_middleware(
 )
 
 
+# Request latency metrics
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """Record the latency of every request, labelled by route template"""
+    if not settings.METRICS_ENABLED or request.url.path == "/metrics":
+        return await call_next(request)
+    with timed(REQUEST_LATENCY, method=request.method, route="unmatched", status="500") as timer:
+        response = await call_next(request)
+        route = request.scope.get("route")
+        if route is not None:
+            timer.labels["route"] = route.path
+        timer.labels["status"] = str(response.status_code)
+    return response
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -116,16 +141,57 @@ async def health_check():
         "status": "healthy",
         "app_name": settings.APP_NAME,
         "version": settings.APP_VERSION,
+        "startup": startup_tracker.stats(),
         "timestamp": datetime.now().isoformat()
     }
 
 
+# Prometheus metrics endpoint
+@app.get(
+    "/metrics",
+    tags=["Health"],
+    summary="Metrics",
+    description="Prometheus metrics for requests, crew stages, searches, tokens, caches and emails",
+    include_in_schema=settings.METRICS_ENABLED
+)
+async def metrics():
+    """
+    Metrics endpoint
+    
+    Only covers work done in this process (crews run by a process
+    executor are not included).
+    
+    Returns:
+        Response: Metrics in the Prometheus text format
+    """
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
+def warm_up_crews() -> None:
+    """Import crewai and pre-build crew templates (blocking)"""
+    import app.core.crew  # noqa: F401 (registers the token streaming listener)
+    crew_template_pool.warm_up()
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Application startup"""
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"API documentation available at: http://{settings.HOST}:{settings.PORT}/docs")
+    await job_service.resume_unfinished()
+    await email_outbox.start()
+    startup_tracker.mark_ready()
+    
+    if settings.WARM_UP_ENABLED:
+        steps = {}
+        if crew_executor.mode == "thread":
+            # Crews run in this process, so warm them up here
+            steps["crew"] = warm_up_crews
+        steps["email"] = email_service.warm_up
+        startup_tracker.warm_up(steps)
 
 
 # Shutdown event
@@ -133,6 +199,12 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown"""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    await job_service.shutdown()
+    await email_outbox.shutdown()
+    await email_service.shutdown()
+    crew_executor.shutdown()
+    crew_template_pool.shutdown()
+    search_client.close()
 
 
 if __name__ == "__main__":
@@ -3,8 +3,14 @@ Request Models
 Pydantic models for API request validation
 """
 
+import re
+
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from typing import List, Literal, Optional
+
+from app.config import settings
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 
 
 class ContentGenerationRequest(BaseModel):
@@ -67,6 +73,21 @@ class ContentGenerationRequest(BaseModel):
         example="Focus on budget-friendly options"
     )
     
+    profile: Literal["fast", "standard", "deep"] = Field(
+        "standard",
+        description=(
+            "Pipeline profile: 'fast' (basic search, no planner, single writer pass), "
+            "'standard' (full pipeline) or 'deep' (full pipeline with more search results)"
+        ),
+        example="standard"
+    )
+    
+    bypass_cache: Optional[bool] = Field(
+        False,
+        description="If true, ignore cached results and research and run the full crew",
+        example=False
+    )
+    
     # Optional: Auto-send via email after generation
     send_email: Optional[bool] = Field(
         False,
@@ -77,7 +98,7 @@ class ContentGenerationRequest(BaseModel):
     recipient_email: Optional[str] = Field(
         None,
         description="Email address to send content to (required if send_email is true)",
-        pattern=r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+        pattern=EMAIL_PATTERN,
         example="client@example.com"
     )
     
@@ -165,7 +186,7 @@ class EmailSendRequest(BaseModel):
     recipient_email: str = Field(
         ...,
         description="Email address to send the content to",
-        pattern=r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
+        pattern=EMAIL_PATTERN,
         example="user@example.com"
     )
     
@@ -216,6 +237,72 @@ class EmailSendRequest(BaseModel):
         }
 
 
+class BulkEmailSendRequest(BaseModel):
+    """
+    Request model for sending one piece of generated content to many recipients
+    """
+    
+    recipient_emails: List[str] = Field(
+        ...,
+        description="Email addresses to send the content to (duplicates are sent once)",
+        min_items=1,
+        example=["client-a@example.com", "client-b@example.com"]
+    )
+    
+    subject: str = Field(
+        ...,
+        description="Email subject line",
+        min_length=1,
+        max_length=200,
+        example="Your AI-Generated Content from ContentPilot"
+    )
+    
+    content: str = Field(
+        ...,
+        description="The generated content to send (markdown format)",
+        min_length=10,
+        example="## Blog Post: Eco-Friendly Travel\\n\\nContent here..."
+    )
+    
+    topics: List[str] = Field(
+        ...,
+        description="Topics that were used to generate the content",
+        min_items=1,
+        example=["Eco-Friendly Travel"]
+    )
+    
+    content_types: str = Field(
+        ...,
+        description="Types of content included",
+        example="Blog posts, Social media posts"
+    )
+    
+    @validator('recipient_emails')
+    def validate_emails(cls, v):
+        """Validate, normalize and deduplicate the recipients"""
+        recipients = list(dict.fromkeys(email.strip().lower() for email in v))
+        invalid = [email for email in recipients if not re.match(EMAIL_PATTERN, email)]
+        if invalid:
+            raise ValueError(f"Invalid email address(es): {', '.join(invalid[:5])}")
+        if len(recipients) > settings.EMAIL_BULK_MAX_RECIPIENTS:
+            raise ValueError(
+                f"Too many recipients ({len(recipients)}), "
+                f"at most {settings.EMAIL_BULK_MAX_RECIPIENTS} per request"
+            )
+        return recipients
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "recipient_emails": ["client-a@example.com", "client-b@example.com"],
+                "subject": "Your AI-Generated Content from ContentPilot",
+                "content": "## Eco-Friendly Travel Guide\\n\\nDiscover sustainable tourism...",
+                "topics": ["Eco-Friendly Travel", "Sustainable Tourism"],
+                "content_types": "Blog posts, Social media posts"
+            }
+        }
+
+
 class HealthCheckResponse(BaseModel):
     """Health check response"""
     
@@ -4,7 +4,7 @@ Pydantic models for API responses
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -37,16 +37,47 @@ class ContentGenerationResponse(BaseModel):
         example=["Eco-Friendly Travel"]
     )
     
+    cached: Optional[bool] = Field(
+        None,
+        description="True if the content was served from the result cache",
+        example=False
+    )
+    
     email_sent: Optional[bool] = Field(
         None,
-        description="Whether email was sent (if auto-send was requested)",
-        example=True
+        description="Whether email was sent (False while the email is queued for delivery)",
+        example=False
     )
     
     email_status: Optional[str] = Field(
         None,
         description="Email send status message (if applicable)",
-        example="Content successfully sent to client@example.com"
+        example="Email to client@example.com queued for delivery"
+    )
+    
+    email_id: Optional[str] = Field(
+        None,
+        description="Outbox id of the auto-sent email (poll GET /content/emails/{email_id})",
+        example="9d41c7f2a0b84b6c8e5f1a2b3c4d5e6f"
+    )
+    
+    run_stats: Optional[dict] = Field(
+        None,
+        description=(
+            "Crew run counters: profile and latency budget, durations, "
+            "tool calls per agent, searches and memo hits"
+        ),
+        example={
+            "profile": "standard",
+            "latency_budget": 180,
+            "over_budget": False,
+            "duration": 84.2,
+            "stage_durations": {"researcher": 41.5, "planner": 18.3, "writer": 24.4},
+            "tool_calls": {"researcher": 4, "planner": 1},
+            "rejected_tool_calls": {},
+            "searches": 4,
+            "memo_hits": 1
+        }
     )
     
     class Config:
@@ -108,34 +139,134 @@ class EmailSendResponse(BaseModel):
     status: str = Field(
         ...,
         description="Status of the email send operation",
-        example="success"
+        example="queued"
     )
     
     message: str = Field(
         ...,
         description="Result message",
-        example="Content successfully sent to user@example.com"
+        example="Email to user@example.com queued for delivery"
     )
     
     timestamp: str = Field(
         ...,
-        description="Timestamp when email was sent (ISO 8601)",
+        description="Timestamp when email was queued (ISO 8601)",
         example="2025-12-29T21:30:00"
     )
     
+    email_id: Optional[str] = Field(
+        None,
+        description="Outbox id (poll GET /content/emails/{email_id} for delivery status)",
+        example="9d41c7f2a0b84b6c8e5f1a2b3c4d5e6f"
+    )
+    
     class Config:
         json_schema_extra = {
             "example": {
-                "status": "success",
-                "message": "Content successfully sent to user@example.com",
-                "timestamp": "2025-12-29T21:30:00"
+                "status": "queued",
+                "message": "Email to user@example.com queued for delivery",
+                "timestamp": "2025-12-29T21:30:00",
+                "email_id": "9d41c7f2a0b84b6c8e5f1a2b3c4d5e6f"
+            }
+        }
+
+
+class EmailStatusResponse(BaseModel):
+    """
+    Delivery status of a queued email
+    """
+    
+    email_id: str = Field(..., description="Outbox id")
+    status: str = Field(..., description="Email status (queued, sending, sent, failed)")
+    recipient_email: str = Field(..., description="Recipient email address")
+    subject: str = Field(..., description="Email subject")
+    attempts: int = Field(..., description="Delivery attempts made")
+    last_error: Optional[str] = Field(None, description="Error of the last failed attempt")
+    created_at: str = Field(..., description="Timestamp when the email was queued")
+    updated_at: str = Field(..., description="Last update timestamp")
+    sent_at: Optional[str] = Field(None, description="Delivery timestamp once sent")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "email_id": "9d41c7f2a0b84b6c8e5f1a2b3c4d5e6f",
+                "status": "sent",
+                "recipient_email": "user@example.com",
+                "subject": "Your AI-Generated Content from ContentPilot",
+                "attempts": 1,
+                "last_error": None,
+                "created_at": "2025-12-29T21:30:00",
+                "updated_at": "2025-12-29T21:30:02",
+                "sent_at": "2025-12-29T21:30:02"
+            }
+        }
+
+
+class BulkEmailRecipient(BaseModel):
+    """
+    One queued recipient of a bulk send
+    """
+    
+    recipient_email: str = Field(..., description="Recipient email address")
+    email_id: str = Field(..., description="Outbox id (poll GET /content/emails/{email_id})")
+    status: str = Field(..., description="Email status (queued on creation)")
+
+
+class BulkEmailSendResponse(BaseModel):
+    """
+    Response model for bulk email sending
+    """
+    
+    batch_id: str = Field(
+        ...,
+        description="Batch id (poll GET /content/emails/batches/{batch_id} for per-recipient status)",
+        example="4c1e8a2b9d7f4e3a8b6c5d4e3f2a1b0c"
+    )
+    status: str = Field(..., description="Status of the bulk send", example="queued")
+    message: str = Field(..., description="Result message", example="2 email(s) queued for delivery")
+    timestamp: str = Field(..., description="Timestamp when the batch was queued (ISO 8601)")
+    recipients: List[BulkEmailRecipient] = Field(..., description="Queued emails, one per recipient")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "batch_id": "4c1e8a2b9d7f4e3a8b6c5d4e3f2a1b0c",
+                "status": "queued",
+                "message": "2 email(s) queued for delivery",
+                "timestamp": "2025-12-29T21:30:00",
+                "recipients": [
+                    {
+                        "recipient_email": "client-a@example.com",
+                        "email_id": "9d41c7f2a0b84b6c8e5f1a2b3c4d5e6f",
+                        "status": "queued"
+                    },
+                    {
+                        "recipient_email": "client-b@example.com",
+                        "email_id": "1a2b3c4d5e6f4a7b8c9d0e1f2a3b4c5d",
+                        "status": "queued"
+                    }
+                ]
             }
         }
 
 
+class EmailBatchStatusResponse(BaseModel):
+    """
+    Delivery status of every recipient of a bulk send
+    """
+    
+    batch_id: str = Field(..., description="Batch id")
+    subject: str = Field(..., description="Email subject")
+    created_at: str = Field(..., description="Timestamp when the batch was queued")
+    total: int = Field(..., description="Number of recipients")
+    counts: Dict[str, int] = Field(..., description="Number of emails by status")
+    completed: bool = Field(..., description="Whether every email is sent or failed")
+    emails: List[EmailStatusResponse] = Field(..., description="Status of each recipient's email")
+
+
 class TaskStatusResponse(BaseModel):
     """
-    Task status response for async operations (future use)
+    Task status response for async generation jobs
     """
     
     task_id: str = Field(..., description="Unique task identifier")
@@ -143,3 +274,21 @@ class TaskStatusResponse(BaseModel):
     created_at: str = Field(..., description="Task creation timestamp")
     updated_at: str = Field(..., description="Last update timestamp")
     result: Optional[dict] = Field(None, description="Task result if completed")
+    error: Optional[str] = Field(None, description="Error message if failed")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "task_id": "3f2b9c0e6a4d4f7e9b1c2d3e4f5a6b7c",
+                "status": "completed",
+                "created_at": "2025-12-28T16:40:00",
+                "updated_at": "2025-12-28T16:45:00",
+                "result": {
+                    "status": "success",
+                    "content": "## Generated Content\\n\\nContent here...",
+                    "generated_at": "2025-12-28T16:45:00",
+                    "topics": ["Eco-Friendly Travel"]
+                },
+                "error": None
+            }
+        }
@@ -3,13 +3,22 @@ Content Generation Service
 Business logic for content generation
 """
 
-from typing import Dict, Any
-from app.core.crew import create_content_crew
+import asyncio
+from typing import Dict, Any, AsyncIterator, Optional
+from app.core.executor import ExecutorSaturatedError, crew_executor, run_crew
+from app.config import settings
+from app.core.run_context import EventSink
+from app.services.result_cache import request_fingerprint, result_cache
 from app.utils.helpers import format_content_result, validate_topics
 from app.utils.logger import setup_logger
+from app.utils.metrics import GENERATIONS_IN_FLIGHT
+from app.utils.single_flight import SingleFlight
 
 logger = setup_logger(__name__)
 
+# Identical generation requests in flight at the same time share one crew run
+generation_flights = SingleFlight("generation")
+
 
 class ContentService:
     """
@@ -17,7 +26,10 @@ class ContentService:
     """
     
     @staticmethod
-    async def generate_content(request_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_content(
+        request_data: Dict[str, Any],
+        progress_sink: Optional[EventSink] = None
+    ) -> Dict[str, Any]:
         """
         Generate content based on request parameters
         
@@ -30,6 +42,10 @@ class ContentService:
                 - content_types: Content types
                 - brand_voice: Brand voice
                 - additional_notes: Optional notes
+                - bypass_cache: Optional flag to skip the result cache
+            progress_sink: Optional callable receiving crew progress events
+                (only honoured by the thread executor, and not when the
+                request joins an identical run already in flight)
         
         Returns:
             Dict: Generated content with metadata
@@ -47,15 +63,30 @@ class ContentService:
             logger.info(f"Starting content generation for {len(topics)} topic(s)")
             logger.info(f"Topics: {', '.join(topics)}")
             
-            # Create and execute crew
-            crew = create_content_crew()
-            result = crew.generate_content(inputs=request_data)
-            
-            # Format result
-            formatted_result = format_content_result(result)
-            formatted_result['topics'] = topics
+            # Identical briefs are served from the result cache (when enabled)
+            fingerprint = request_fingerprint(request_data)
+            use_cache = settings.RESULT_CACHE_ENABLED and not request_data.get('bypass_cache')
+            cached_result = result_cache.get(fingerprint) if use_cache else None
             
-            logger.info(f"Content generation successful for topics: {', '.join(topics)}")
+            if cached_result is not None:
+                logger.info(f"Result cache hit for topics: {', '.join(topics)}")
+                formatted_result = dict(cached_result, cached=True)
+            else:
+                # Duplicate requests arriving meanwhile attach to this run
+                output = await generation_flights.run(
+                    fingerprint,
+                    lambda: ContentService._execute_crew(request_data, progress_sink)
+                )
+                
+                # Format result
+                formatted_result = format_content_result(output['content'])
+                formatted_result['topics'] = topics
+                formatted_result['run_stats'] = output['run_stats']
+                if use_cache:
+                    # Store a copy: email fields added below are per request
+                    result_cache.set(fingerprint, dict(formatted_result))
+                
+                logger.info(f"Content generation successful for topics: {', '.join(topics)}")
             
             # Check if auto-send email is requested
             send_email = request_data.get('send_email', False)
@@ -65,8 +96,8 @@ class ContentService:
                 if recipient_email:
                     logger.info(f"Auto-send email requested to: {recipient_email}")
                     
-                    # Import email service here to avoid circular imports
-                    from app.services.email_service import email_service
+                    # Import the outbox here to avoid circular imports
+                    from app.services.outbox_service import email_outbox
                     
                     # Generate email subject if not provided
                     email_subject = request_data.get('email_subject')
@@ -76,8 +107,8 @@ class ContentService:
                             topics_str += f" and {len(topics) - 2} more"
                         email_subject = f"Your AI-Generated Content: {topics_str}"
                     
-                    # Send email
-                    email_result = email_service.send_content_email(
+                    # Queue email (delivered in the background, off the request path)
+                    email = email_outbox.enqueue(
                         to=recipient_email,
                         subject=email_subject,
                         content=formatted_result['content'],
@@ -86,13 +117,9 @@ class ContentService:
                     )
                     
                     # Add email status to result
-                    formatted_result['email_sent'] = email_result['status'] == 'success'
-                    formatted_result['email_status'] = email_result['message']
-                    
-                    if email_result['status'] == 'success':
-                        logger.info(f"Email sent successfully to {recipient_email}")
-                    else:
-                        logger.warning(f"Email sending failed: {email_result['message']}")
+                    formatted_result['email_sent'] = False
+                    formatted_result['email_status'] = f"Email to {recipient_email} queued for delivery"
+                    formatted_result['email_id'] = email['email_id']
                 else:
                     logger.warning("send_email is True but recipient_email is missing")
                     formatted_result['email_sent'] = False
@@ -103,10 +130,80 @@ class ContentService:
         except ValueError as ve:
             logger.error(f"Validation error: {str(ve)}")
             raise
+        except ExecutorSaturatedError:
+            raise
         except Exception as e:
             logger.error(f"Content generation failed: {str(e)}", exc_info=True)
             raise Exception(f"Content generation failed: {str(e)}")
     
+    @staticmethod
+    async def _execute_crew(
+        request_data: Dict[str, Any],
+        progress_sink: Optional[EventSink] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the crew on the worker pool so the event loop stays responsive
+        
+        Args:
+            request_data: Content generation parameters
+            progress_sink: Optional callable receiving crew progress events
+        
+        Returns:
+            Dict: Raw crew `content` and `run_stats`
+        """
+        with GENERATIONS_IN_FLIGHT.track_inprogress():
+            if progress_sink is not None and crew_executor.supports_progress:
+                return await crew_executor.run(run_crew, request_data, progress_sink)
+            return await crew_executor.run(run_crew, request_data)
+    
+    async def stream_content(self, request_data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate content while yielding progress events as they happen
+        
+        Yields the crew's progress events (run_started, task_started,
+        tool_call, search_finished, token, task_completed, ...) followed by a final
+        `complete` event carrying the full result, or an `error` event.
+        
+        Args:
+            request_data: Dictionary containing content generation parameters
+        
+        Yields:
+            Dict: Progress events, each with `event`, `stage` and `elapsed`
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        
+        def sink(event: Dict[str, Any]) -> None:
+            # Called from the crew worker thread
+            loop.call_soon_threadsafe(events.put_nowait, event)
+        
+        generation = asyncio.create_task(self.generate_content(request_data, progress_sink=sink))
+        try:
+            while not generation.done():
+                next_event = asyncio.create_task(events.get())
+                await asyncio.wait({next_event, generation}, return_when=asyncio.FIRST_COMPLETED)
+                if next_event.done():
+                    yield next_event.result()
+                else:
+                    next_event.cancel()
+            
+            # Events are queued before the worker result is delivered, drain them first
+            while not events.empty():
+                yield events.get_nowait()
+            
+            try:
+                yield {"event": "complete", "result": generation.result()}
+            except ExecutorSaturatedError as se:
+                yield {"event": "error", "status_code": 503, "detail": str(se)}
+            except ValueError as ve:
+                yield {"event": "error", "status_code": 400, "detail": str(ve)}
+            except Exception as e:
+                yield {"event": "error", "status_code": 500, "detail": str(e)}
+        finally:
+            if not generation.done():
+                # Client went away: drop the run if it has not started yet
+                generation.cancel()
+    
     @staticmethod
     async def validate_request(request_data: Dict[str, Any]) -> bool:
         """
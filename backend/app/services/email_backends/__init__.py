@@ -0,0 +1,4 @@
+"""
+Email Backends Package
+Transports that deliver rendered emails (Gmail API or SMTP)
+"""
@@ -0,0 +1,103 @@
+"""
+Email Backend Base
+Interface shared by the email transports
+"""
+
+from email.message import Message
+from typing import Any, Dict, Optional
+
+from app.config import settings
+
+EMAIL_BACKENDS = ("gmail", "smtp")
+
+
+class EmailDeliveryError(Exception):
+    """Raised when a backend fails to deliver a message"""
+
+    def __init__(self, message: str, retryable: bool = True):
+        """
+        Initialize the error
+
+        Args:
+            message: What went wrong
+            retryable: Whether sending again later may succeed
+        """
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class EmailBackend:
+    """
+    Transport that delivers fully rendered messages
+
+    Backends are driven from the event loop: the outbox awaits `send`
+    once per message, with up to EMAIL_WORKER_CONCURRENCY sends in flight.
+    """
+
+    name = "base"
+
+    async def send(self, message: Message) -> str:
+        """
+        Deliver a message
+
+        Args:
+            message: Rendered message (To and Subject set)
+
+        Returns:
+            str: Provider message id
+
+        Raises:
+            EmailDeliveryError: If the provider rejects or cannot take the message
+        """
+        raise NotImplementedError
+
+    def warm_up(self) -> None:
+        """Prepare ahead of the first send (blocking, runs on the warm-up thread)"""
+
+    async def close(self) -> None:
+        """Release connections and background work"""
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get backend state
+
+        Returns:
+            Dict: Backend name and transport-specific counters
+        """
+        return {"backend": self.name}
+
+
+def create_email_backend(name: Optional[str] = None) -> EmailBackend:
+    """
+    Create an email backend from the settings
+
+    Only the selected backend's module is imported, so the Gmail client
+    library is not loaded for SMTP delivery and vice versa.
+
+    Args:
+        name: Backend name (defaults to EMAIL_BACKEND)
+
+    Returns:
+        EmailBackend: The configured backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    name = (name or settings.EMAIL_BACKEND).lower()
+    if name == "gmail":
+        from app.services.email_backends.gmail import GmailBackend
+        return GmailBackend(concurrency=settings.EMAIL_WORKER_CONCURRENCY)
+    if name == "smtp":
+        from app.services.email_backends.smtp import SMTPBackend
+        return SMTPBackend(
+            hostname=settings.SMTP_SERVER,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USER,
+            password=settings.SMTP_PASSWORD,
+            sender=settings.FROM_EMAIL,
+            pool_size=settings.EMAIL_WORKER_CONCURRENCY,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+            idle_timeout=settings.SMTP_IDLE_TIMEOUT
+        )
+    raise ValueError(f"Invalid email backend '{name}', expected one of {EMAIL_BACKENDS}")
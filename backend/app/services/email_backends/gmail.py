@@ -0,0 +1,270 @@
+"""
+Gmail Email Backend
+Sends messages through the Gmail API with OAuth
+"""
+
+import asyncio
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.message import Message
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from googleapiclient.errors import HttpError
+
+from app.config import settings
+from app.services.email_backends.base import EmailBackend, EmailDeliveryError
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Gmail API scopes
+GMAIL_SCOPES = ['https://www.googleapis.com/auth/gmail.send']
+
+
+def backend_path(path: str) -> Path:
+    """Resolve a credentials path relative to the backend folder"""
+    return Path(__file__).parent.parent.parent.parent / path
+
+
+class GmailBackend(EmailBackend):
+    """
+    Email backend using the Gmail API with OAuth
+
+    Gmail is authenticated on first use (or by warm_up) from the saved
+    token, so a missing or broken credential fails email sends instead of
+    application startup. The server never starts the interactive OAuth
+    flow; run `python -m app.services.email_service` once to create the
+    token. A background thread refreshes the token before it expires.
+
+    Gmail API clients sit on httplib2, which is blocking and not
+    thread-safe, so sends run on a pool of `concurrency` sender threads
+    and each thread gets its own client (and keep-alive connection)
+    built on the shared credentials.
+    """
+
+    name = "gmail"
+
+    def __init__(self, concurrency: int = 1):
+        """
+        Initialize the backend (Gmail is authenticated lazily)
+
+        Args:
+            concurrency: Sender threads (and Gmail clients)
+        """
+        self.concurrency = max(1, concurrency)
+        self._credentials = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._senders: Optional[ThreadPoolExecutor] = None
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+
+    async def send(self, message: Message) -> str:
+        """
+        Deliver a message on one of the sender threads
+
+        Args:
+            message: Rendered message
+
+        Returns:
+            str: Gmail message id
+
+        Raises:
+            EmailDeliveryError: If the Gmail API rejects the message
+        """
+        if self._senders is None:
+            self._senders = ThreadPoolExecutor(
+                max_workers=self.concurrency,
+                thread_name_prefix="gmail-sender"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._senders, self._send_blocking, message
+        )
+
+    def _send_blocking(self, message: Message) -> str:
+        """Encode and send a message with this thread's client"""
+        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        try:
+            response = self._get_gmail_service().users().messages().send(
+                userId='me',
+                body={'raw': raw}
+            ).execute()
+        except HttpError as error:
+            raise EmailDeliveryError(
+                f"Gmail API error: {str(error)}",
+                retryable=self._is_retryable(error)
+            ) from error
+        return response.get("id", "")
+
+    @staticmethod
+    def _is_retryable(error: HttpError) -> bool:
+        """
+        Whether a Gmail API error may succeed if sent again later
+
+        Rate limit and server errors are transient; other client errors
+        (e.g. an invalid recipient) fail the same way on every attempt.
+
+        Args:
+            error: Gmail API error
+
+        Returns:
+            bool: True for transient errors
+        """
+        status_code = error.resp.status
+        if status_code == 429 or status_code >= 500:
+            return True
+        # Quota errors come back as 403 with a (user)RateLimitExceeded reason
+        return status_code == 403 and "ratelimitexceeded" in str(error.content).lower()
+
+    def _get_gmail_service(self) -> Any:
+        """
+        Get this thread's Gmail API client, authenticating on first use
+
+        Returns:
+            Gmail API service resource (only to be used by the calling thread)
+        """
+        service = getattr(self._local, "service", None)
+        if service is None:
+            self._ensure_authenticated()
+            service = self._build_service()
+            self._local.service = service
+        return service
+
+    def _ensure_authenticated(self) -> None:
+        """Load the shared credentials once"""
+        with self._lock:
+            if self._credentials is None:
+                self._authenticate_gmail()
+
+    def _build_service(self) -> Any:
+        """
+        Build a Gmail API client on the shared credentials
+
+        The discovery document bundled with the client library is used,
+        so building a client never goes to the network.
+
+        Returns:
+            Gmail API service resource
+        """
+        from googleapiclient.discovery import build
+
+        client_options = None
+        if settings.GMAIL_API_ENDPOINT:
+            client_options = {"api_endpoint": settings.GMAIL_API_ENDPOINT}
+
+        return build(
+            'gmail',
+            'v1',
+            credentials=self._credentials,
+            client_options=client_options,
+            static_discovery=True,
+            cache_discovery=False
+        )
+
+    def warm_up(self) -> None:
+        """Authenticate ahead of the first send if a saved token exists"""
+        if not backend_path(settings.GMAIL_TOKEN_PATH).exists():
+            logger.info(
+                "Gmail token not found, email sends will fail until it is created "
+                "with: python -m app.services.email_service"
+            )
+            return
+        self._ensure_authenticated()
+
+    def _authenticate_gmail(self) -> None:
+        """
+        Authenticate with Gmail API using the saved OAuth token
+
+        Raises:
+            RuntimeError: If no usable token exists
+        """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+
+        try:
+            token_file = backend_path(settings.GMAIL_TOKEN_PATH)
+            if not token_file.exists():
+                raise RuntimeError(
+                    f"Gmail is not authorized: {token_file} not found. "
+                    f"Create it with: python -m app.services.email_service"
+                )
+
+            creds = Credentials.from_authorized_user_file(str(token_file), GMAIL_SCOPES)
+            if not creds.valid:
+                if not (creds.expired and creds.refresh_token):
+                    raise RuntimeError(
+                        "Gmail token is invalid and cannot be refreshed. "
+                        "Re-authorize with: python -m app.services.email_service"
+                    )
+                logger.info("Refreshing expired credentials")
+                creds.refresh(Request())
+                token_file.write_text(creds.to_json())
+
+            if settings.GMAIL_API_ENDPOINT:
+                logger.info(f"Using Gmail API endpoint: {settings.GMAIL_API_ENDPOINT}")
+
+            self._credentials = creds
+            self._start_refresher()
+            logger.info("✅ Gmail API authenticated successfully!")
+
+        except Exception as e:
+            logger.error(f"Gmail authentication failed: {str(e)}")
+            raise
+
+    def _start_refresher(self) -> None:
+        """Start the background token refresh thread (once)"""
+        if self._refresher is not None or self._credentials.expiry is None:
+            return
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            name="gmail-token-refresh",
+            daemon=True
+        )
+        self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        """
+        Refresh the access token shortly before it expires
+
+        The margin is larger than google-auth's own refresh threshold, so
+        sends always find a valid token and never refresh inline.
+        """
+        from google.auth.transport.requests import Request
+
+        token_file = backend_path(settings.GMAIL_TOKEN_PATH)
+        while True:
+            remaining = (self._credentials.expiry - datetime.utcnow()).total_seconds()
+            delay = max(0.0, remaining - settings.GMAIL_TOKEN_REFRESH_MARGIN)
+            if self._stop_refresh.wait(delay):
+                return
+            try:
+                self._credentials.refresh(Request())
+                token_file.write_text(self._credentials.to_json())
+                logger.info(f"Gmail token refreshed, valid until {self._credentials.expiry.isoformat()}Z")
+            except Exception as e:
+                logger.warning(f"Gmail token refresh failed, retrying in 60s: {str(e)}")
+                if self._stop_refresh.wait(60):
+                    return
+
+    async def close(self) -> None:
+        """Stop the token refresh and the sender threads"""
+        self._stop_refresh.set()
+        if self._senders is not None:
+            self._senders.shutdown(wait=False, cancel_futures=True)
+            self._senders = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get backend state
+
+        Returns:
+            Dict: Backend name, sender threads and whether Gmail is authenticated
+        """
+        return {
+            "backend": self.name,
+            "concurrency": self.concurrency,
+            "authenticated": self._credentials is not None
+        }
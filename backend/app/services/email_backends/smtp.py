@@ -0,0 +1,241 @@
+"""
+SMTP Email Backend
+Sends messages over a pool of persistent, authenticated SMTP connections
+"""
+
+import asyncio
+import time
+from email.message import Message
+from email.utils import make_msgid
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiosmtplib import (
+    SMTP,
+    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPResponseException,
+    SMTPServerDisconnected
+)
+
+from app.services.email_backends.base import EmailBackend, EmailDeliveryError
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SMTPBackend(EmailBackend):
+    """
+    Email backend for any SMTP relay
+
+    Connecting, TLS and AUTH take several round trips, which dominate the
+    cost of a message sent on a fresh connection. The backend therefore
+    reuses persistent authenticated connections: each one is
+    authenticated once and then carries message after message, one
+    message at a time (no ESMTP PIPELINING; every command waits for its
+    reply), with up to `pool_size` connections sending in parallel.
+    Connections left idle for `idle_timeout` are closed by a timer, even
+    when no further message is sent (relays drop idle clients anyway),
+    and a send whose pooled connection was dropped by the relay is
+    retried once on a new connection.
+    """
+
+    name = "smtp"
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        sender: Optional[str] = None,
+        pool_size: int = 1,
+        use_tls: bool = False,
+        timeout: float = 30,
+        idle_timeout: float = 60
+    ):
+        """
+        Initialize the backend (connections are opened on demand)
+
+        Args:
+            hostname: SMTP relay host
+            port: SMTP relay port
+            username: Login name (no login if None)
+            password: Login password
+            sender: From address (defaults to the username)
+            pool_size: Maximum open connections
+            use_tls: Connect with implicit TLS; otherwise STARTTLS is used when offered
+            timeout: Seconds allowed per connect and per command
+            idle_timeout: Seconds before an unused connection is closed
+        """
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.sender = sender or username
+        self.pool_size = max(1, pool_size)
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[SMTP, float]] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._reaper: Optional[asyncio.TimerHandle] = None
+        self.connections_opened = 0
+        self.messages_sent = 0
+
+    async def send(self, message: Message) -> str:
+        """
+        Deliver a message over a pooled connection
+
+        Args:
+            message: Rendered message (From and Message-ID are added if missing)
+
+        Returns:
+            str: Message-ID of the sent message
+
+        Raises:
+            EmailDeliveryError: If the relay rejects the message or cannot be reached
+        """
+        if not self.sender:
+            raise EmailDeliveryError("SMTP sender is not configured (set FROM_EMAIL or SMTP_USER)", retryable=False)
+        if message["From"] is None:
+            message["From"] = self.sender
+        if message["Message-ID"] is None:
+            message["Message-ID"] = make_msgid(domain=self.sender.rpartition("@")[2] or None)
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+
+        async with self._slots:
+            connection = self._checkout()
+            try:
+                if connection is None:
+                    connection = await self._connect()
+                    await connection.send_message(message)
+                else:
+                    try:
+                        await connection.send_message(message)
+                    except SMTPServerDisconnected:
+                        logger.debug("Pooled SMTP connection was closed by the relay, reconnecting")
+                        connection = await self._connect()
+                        await connection.send_message(message)
+            except SMTPException as error:
+                self._checkin(connection, healthy=isinstance(error, SMTPResponseException))
+                raise EmailDeliveryError(
+                    f"SMTP error: {str(error)}",
+                    retryable=self._is_retryable(error)
+                ) from error
+            self._checkin(connection)
+
+        self.messages_sent += 1
+        return message["Message-ID"]
+
+    @staticmethod
+    def _is_retryable(error: SMTPException) -> bool:
+        """
+        Whether an SMTP error may succeed if sent again later
+
+        4xx replies are transient by definition, 5xx replies are permanent.
+        Connection and timeout errors are treated as transient.
+
+        Args:
+            error: SMTP error
+
+        Returns:
+            bool: True for transient errors
+        """
+        if isinstance(error, SMTPRecipientsRefused):
+            return all(refused.code < 500 for refused in error.recipients)
+        if isinstance(error, SMTPResponseException):
+            return error.code < 500
+        return True
+
+    def _checkout(self) -> Optional[SMTP]:
+        """Take the most recently used live connection from the pool (None if there is none)"""
+        now = time.monotonic()
+        while self._idle:
+            connection, last_used = self._idle.pop()
+            if connection.is_connected and now - last_used < self.idle_timeout:
+                return connection
+            connection.close()
+        return None
+
+    def _checkin(self, connection: Optional[SMTP], healthy: bool = True) -> None:
+        """Return a connection to the pool, or close it if it cannot be reused"""
+        if connection is None:
+            return
+        if healthy and connection.is_connected:
+            self._idle.append((connection, time.monotonic()))
+            self._schedule_reap()
+        else:
+            connection.close()
+
+    def _schedule_reap(self) -> None:
+        """Arrange for the oldest idle connection to be closed once it times out"""
+        if self._reaper is None and self._idle:
+            oldest = min(last_used for _, last_used in self._idle)
+            delay = max(0.0, oldest + self.idle_timeout - time.monotonic())
+            self._reaper = asyncio.get_running_loop().call_later(delay, self._reap)
+
+    def _reap(self) -> None:
+        """Close connections idle for `idle_timeout` or dropped by the relay"""
+        self._reaper = None
+        now = time.monotonic()
+        live = []
+        for connection, last_used in self._idle:
+            if connection.is_connected and now - last_used < self.idle_timeout:
+                live.append((connection, last_used))
+            else:
+                connection.close()
+        if len(live) < len(self._idle):
+            logger.debug(f"Closed {len(self._idle) - len(live)} idle SMTP connection(s)")
+        self._idle = live
+        self._schedule_reap()
+
+    async def _connect(self) -> SMTP:
+        """
+        Open and authenticate a new connection
+
+        Returns:
+            SMTP: Connected client
+        """
+        connection = SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=self.use_tls,
+            start_tls=False if self.use_tls else None,
+            timeout=self.timeout
+        )
+        await connection.connect()
+        self.connections_opened += 1
+        logger.debug(f"Opened SMTP connection to {self.hostname}:{self.port}")
+        return connection
+
+    async def close(self) -> None:
+        """Close the pooled connections"""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            try:
+                await connection.quit()
+            except SMTPException:
+                connection.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get backend state
+
+        Returns:
+            Dict: Relay, pool usage and how many messages each connection carried
+        """
+        return {
+            "backend": self.name,
+            "relay": f"{self.hostname}:{self.port}",
+            "pool_size": self.pool_size,
+            "idle_connections": len(self._idle),
+            "connections_opened": self.connections_opened,
+            "messages_sent": self.messages_sent
+        }
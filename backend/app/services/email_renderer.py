@@ -0,0 +1,320 @@
+"""
+Email Renderer
+Turns generated markdown into the HTML and plain text bodies of content emails
+"""
+
+import hashlib
+import re
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import markdown2
+
+from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MARKDOWN_EXTRAS = ["tables", "fenced-code-blocks"]
+
+# Placeholders are {{name}}; single braces (CSS) are left alone
+PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .email-container {
+            background-color: white;
+            border-radius: 10px;
+            padding: 40px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header {
+            border-bottom: 3px solid #1E88E5;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            color: #1E88E5;
+            margin: 0;
+            font-size: 28px;
+        }
+        .meta-info {
+            background-color: #f0f8ff;
+            border-left: 4px solid #1E88E5;
+            padding: 15px 20px;
+            margin: 20px 0;
+            border-radius: 5px;
+        }
+        .meta-info p {
+            margin: 5px 0;
+            color: #555;
+        }
+        .meta-info strong {
+            color: #1E88E5;
+        }
+        .content {
+            margin-top: 30px;
+        }
+        .content h2 {
+            color: #1E88E5;
+            border-bottom: 2px solid #e0e0e0;
+            padding-bottom: 10px;
+        }
+        .content h3 {
+            color: #42A5F5;
+        }
+        .content p {
+            margin: 15px 0;
+        }
+        .content ul, .content ol {
+            padding-left: 25px;
+        }
+        .content li {
+            margin: 8px 0;
+        }
+        .footer {
+            margin-top: 50px;
+            padding-top: 20px;
+            border-top: 2px solid #e0e0e0;
+            text-align: center;
+            color: #888;
+            font-size: 14px;
+        }
+        code {
+            background-color: #f4f4f4;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+        }
+        pre {
+            background-color: #f4f4f4;
+            padding: 15px;
+            border-radius: 5px;
+            overflow-x: auto;
+        }
+    </style>
+</head>
+<body>
+    <div class="email-container">
+        <div class="header">
+            <h1>✍️ ContentPilot AI</h1>
+            <p style="color: #666; margin: 10px 0 0 0;">Your AI-Generated Content is Ready!</p>
+        </div>
+        
+        <div class="meta-info">
+            <p><strong>📌 Topics:</strong> {{topics}}</p>
+            <p><strong>📝 Content Types:</strong> {{content_types}}</p>
+            <p><strong>📅 Generated:</strong> {{generated}}</p>
+        </div>
+        
+        <div class="content">
+            {{content}}
+        </div>
+        
+        <div class="footer">
+            <p>Generated by <strong>ContentPilot AI</strong></p>
+            <p style="margin-top: 10px; font-size: 12px;">
+                This content was automatically generated using advanced AI agents.
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+TEXT_TEMPLATE = """
+═══════════════════════════════════════════════
+        CONTENTPILOT AI - GENERATED CONTENT
+═══════════════════════════════════════════════
+
+Topics: {{topics}}
+Content Types: {{content_types}}
+Generated: {{generated}}
+
+───────────────────────────────────────────────
+
+{{content}}
+
+───────────────────────────────────────────────
+Generated by ContentPilot AI
+═══════════════════════════════════════════════
+"""
+
+
+class CompiledTemplate:
+    """
+    Template split once into static chunks and placeholder names
+
+    Rendering is a single join of the static chunks with the field
+    values, so the static CSS, header and footer are never rebuilt.
+    """
+
+    def __init__(self, template: str):
+        """
+        Compile a template
+
+        Args:
+            template: Text with {{name}} placeholders
+        """
+        parts = PLACEHOLDER.split(template)
+        self.chunks: List[str] = parts[0::2]
+        self.fields: List[str] = parts[1::2]
+
+    def render(self, values: Dict[str, str]) -> str:
+        """
+        Fill in the placeholders
+
+        Args:
+            values: Text for every placeholder
+
+        Returns:
+            str: Rendered text
+        """
+        out = [self.chunks[0]]
+        for field, chunk in zip(self.fields, self.chunks[1:]):
+            out.append(values[field])
+            out.append(chunk)
+        return "".join(out)
+
+
+class EmailRenderer:
+    """
+    Renderer for content emails
+
+    Converting markdown is by far the most expensive step, so its output
+    is memoized by content hash in a bounded LRU: resending the same
+    content, or sending it to several recipients, skips the conversion
+    and only fills in the precompiled templates. Thread-safe (each thread
+    keeps its own markdown converter).
+    """
+
+    def __init__(self, cache: Optional[TTLCache] = None):
+        """
+        Initialize the renderer
+
+        Args:
+            cache: Cache for converted markdown (None converts on every render)
+        """
+        self.cache = cache
+        self.html_template = CompiledTemplate(HTML_TEMPLATE)
+        self.text_template = CompiledTemplate(TEXT_TEMPLATE)
+        self._local = threading.local()
+
+    def render(self, content: str, topics: List[str], content_types: str) -> Tuple[str, str]:
+        """
+        Render both bodies of a content email
+
+        Args:
+            content: Generated content (markdown format)
+            topics: List of topics
+            content_types: Types of content generated
+
+        Returns:
+            Tuple: HTML body and plain text body
+        """
+        values = self._header_values(topics, content_types)
+        html = self.html_template.render(dict(values, content=self.markdown_to_html(content)))
+        text = self.text_template.render(dict(values, content=content))
+        return html, text
+
+    def render_html(self, content: str, topics: List[str], content_types: str) -> str:
+        """
+        Render the HTML body of a content email
+
+        Args:
+            content: Generated content (markdown format)
+            topics: List of topics
+            content_types: Types of content generated
+
+        Returns:
+            str: HTML body
+        """
+        values = self._header_values(topics, content_types)
+        return self.html_template.render(dict(values, content=self.markdown_to_html(content)))
+
+    def render_text(self, content: str, topics: List[str], content_types: str) -> str:
+        """
+        Render the plain text body of a content email
+
+        Args:
+            content: Generated content (markdown format)
+            topics: List of topics
+            content_types: Types of content generated
+
+        Returns:
+            str: Plain text body
+        """
+        values = self._header_values(topics, content_types)
+        return self.text_template.render(dict(values, content=content))
+
+    def markdown_to_html(self, content: str) -> str:
+        """
+        Convert markdown to HTML, reusing earlier conversions of the same content
+
+        Args:
+            content: Markdown text
+
+        Returns:
+            str: HTML fragment
+        """
+        if self.cache is None:
+            return self._convert(content)
+
+        key = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        html = self.cache.get(key)
+        if html is None:
+            html = self._convert(content)
+            self.cache.set(key, html)
+        return html
+
+    def _convert(self, content: str) -> str:
+        """Convert markdown with this thread's converter"""
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = markdown2.Markdown(extras=MARKDOWN_EXTRAS)
+            self._local.converter = converter
+        return str(converter.convert(content))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get markdown cache counters
+
+        Returns:
+            Dict: Cache stats (empty if caching is disabled)
+        """
+        return self.cache.stats() if self.cache is not None else {}
+
+    @staticmethod
+    def _header_values(topics: List[str], content_types: str) -> Dict[str, str]:
+        """Values shared by the HTML and text headers"""
+        return {
+            "topics": ", ".join(topics),
+            "content_types": content_types,
+            "generated": datetime.now().strftime("%B %d, %Y at %I:%M %p")
+        }
+
+
+# Create renderer instance
+email_renderer = EmailRenderer(
+    TTLCache(
+        namespace="email_render",
+        ttl=settings.EMAIL_RENDER_CACHE_TTL,
+        max_entries=settings.EMAIL_RENDER_CACHE_MAX_ENTRIES
+    ) if settings.EMAIL_RENDER_CACHE_ENABLED else None
+)
@@ -0,0 +1,116 @@
+"""
+Job Service
+Runs content generation as background jobs tracked in the job store
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Set
+
+from app.core.executor import ExecutorSaturatedError, crew_executor
+from app.db.job_store import (
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PROCESSING,
+    JobStore,
+    job_store
+)
+from app.services.content_service import content_service
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Seconds to wait before retrying a job when the crew executor is full
+SATURATED_RETRY_DELAY = 5
+
+
+class JobService:
+    """
+    Service class for asynchronous content generation jobs
+    """
+
+    def __init__(self, store: JobStore):
+        """Initialize the job service"""
+        self.store = store
+        self._tasks: Set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def submit(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store a new job and start it in the background
+
+        Args:
+            request_data: Content generation parameters
+
+        Returns:
+            Dict: Stored job (status pending)
+        """
+        job = self.store.create(request_data)
+        self._schedule(job["task_id"], request_data)
+        logger.info(f"Job {job['task_id']} queued for topics: {request_data.get('content_topics')}")
+        return job
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job by id
+
+        Args:
+            task_id: Job identifier
+
+        Returns:
+            Optional[Dict]: Job, or None if unknown
+        """
+        return self.store.get(task_id)
+
+    async def resume_unfinished(self) -> int:
+        """
+        Restart jobs left pending or processing by a previous process
+
+        Returns:
+            int: Number of resumed jobs
+        """
+        jobs = self.store.list_unfinished()
+        for job in jobs:
+            self._schedule(job["task_id"], job["request"])
+        if jobs:
+            logger.info(f"Resumed {len(jobs)} unfinished job(s)")
+        return len(jobs)
+
+    def _schedule(self, task_id: str, request_data: Dict[str, Any]) -> None:
+        """Start a job task and keep a reference until it finishes"""
+        task = asyncio.create_task(self._run(task_id, request_data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, task_id: str, request_data: Dict[str, Any]) -> None:
+        """Execute a job and record its outcome"""
+        # Jobs wait here (still pending) rather than in the executor queue,
+        # leaving executor queue slots for interactive requests
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(crew_executor.max_concurrency)
+
+        async with self._slots:
+            self.store.update_status(task_id, JOB_PROCESSING)
+            while True:
+                try:
+                    result = await content_service.generate_content(request_data)
+                    self.store.update_status(task_id, JOB_COMPLETED, result=result)
+                    logger.info(f"Job {task_id} completed")
+                    return
+                except ExecutorSaturatedError:
+                    logger.info(f"Job {task_id} waiting for a free crew worker")
+                    await asyncio.sleep(SATURATED_RETRY_DELAY)
+                except Exception as e:
+                    logger.error(f"Job {task_id} failed: {str(e)}")
+                    self.store.update_status(task_id, JOB_FAILED, error=str(e))
+                    return
+
+    async def shutdown(self) -> None:
+        """Cancel running job tasks (they are resumed on next start)"""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.store.close()
+
+
+# Create service instance
+job_service = JobService(job_store)
@@ -0,0 +1,316 @@
+"""
+Outbox Service
+Queues emails and delivers them in the background with retries and rate limiting
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from app.config import settings
+from app.db.outbox_store import EMAIL_FAILED, EMAIL_SENT, OutboxStore, outbox_store
+from app.services.email_renderer import email_renderer
+from app.services.email_service import email_service
+from app.utils.cache import TTLCache
+from app.utils.logger import setup_logger
+from app.utils.rate_limiter import RateLimiter
+
+logger = setup_logger(__name__)
+
+# Longest the dispatcher sleeps when nothing is due (new emails wake it early)
+IDLE_POLL_INTERVAL = 30
+
+# Pause after a dispatcher error (e.g. the outbox database is locked)
+DISPATCH_ERROR_DELAY = 5
+
+
+class EmailOutbox:
+    """
+    Persistent email outbox
+
+    Emails are stored first and sent by a background dispatcher, so
+    callers never wait on the email provider. Sends are paced by a token
+    bucket matching the provider quota, and failed sends are retried with
+    exponential backoff until EMAIL_MAX_ATTEMPTS is reached. Emails
+    interrupted by a restart are sent again on the next start.
+
+    Up to `concurrency` sends are in flight at once; the email backend
+    sizes its sender threads or connection pool to match. Bulk sends are
+    rendered once per batch and their members are delivered like any
+    other email, under the same rate limit.
+    """
+
+    def __init__(self, store: OutboxStore):
+        """Initialize the outbox (call start to begin delivering)"""
+        self.store = store
+        self.limiter = RateLimiter("email", settings.EMAIL_SEND_RATE, settings.EMAIL_SEND_BURST)
+        self.concurrency = max(1, settings.EMAIL_WORKER_CONCURRENCY)
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._sends: Set[asyncio.Task] = set()
+        self._wake: Optional[asyncio.Event] = None
+        # Rendered bodies of recent batches, so members do not reload them per send
+        self._batches = TTLCache("email_batch", ttl=3600, max_entries=8)
+
+    def enqueue(
+        self,
+        to: str,
+        subject: str,
+        content: str,
+        topics: List[str],
+        content_types: str
+    ) -> Dict[str, Any]:
+        """
+        Queue an email for delivery
+
+        Args:
+            to: Recipient email address
+            subject: Email subject
+            content: Generated content (markdown format)
+            topics: List of topics
+            content_types: Types of content generated
+
+        Returns:
+            Dict: Stored email (status queued)
+        """
+        email = self.store.create(
+            to,
+            subject,
+            {"content": content, "topics": topics, "content_types": content_types}
+        )
+        if self._wake is not None:
+            self._wake.set()
+        logger.info(f"Email {email['email_id']} to {to} queued")
+        return email
+
+    async def enqueue_batch(
+        self,
+        recipients: List[str],
+        subject: str,
+        content: str,
+        topics: List[str],
+        content_types: str
+    ) -> Dict[str, Any]:
+        """
+        Render content once and queue it for every recipient
+
+        Args:
+            recipients: Recipient email addresses
+            subject: Email subject
+            content: Generated content (markdown format)
+            topics: List of topics
+            content_types: Types of content generated
+
+        Returns:
+            Dict: Batch id, creation time and the queued emails
+        """
+        # Rendering is CPU-bound, so keep it off the event loop
+        html_body, text_body = await asyncio.to_thread(
+            email_renderer.render, content, topics, content_types
+        )
+        batch = await asyncio.to_thread(
+            self.store.create_batch, recipients, subject, html_body, text_body
+        )
+        if self._wake is not None:
+            self._wake.set()
+        logger.info(f"Batch {batch['batch_id']} of {len(recipients)} email(s) queued")
+        return batch
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a batch with the status of every recipient
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Optional[Dict]: Batch id, subject, creation time, counts by
+                status and member emails, or None if unknown
+        """
+        batch = self.store.get_batch(batch_id)
+        if batch is None:
+            return None
+
+        emails = self.store.list_batch_emails(batch_id)
+        counts: Dict[str, int] = {}
+        for email in emails:
+            counts[email["status"]] = counts.get(email["status"], 0) + 1
+        return {
+            "batch_id": batch_id,
+            "subject": batch["subject"],
+            "created_at": batch["created_at"],
+            "total": len(emails),
+            "counts": counts,
+            "completed": all(email["status"] in (EMAIL_SENT, EMAIL_FAILED) for email in emails),
+            "emails": emails
+        }
+
+    def get(self, email_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an email by id
+
+        Args:
+            email_id: Email identifier
+
+        Returns:
+            Optional[Dict]: Email, or None if unknown
+        """
+        return self.store.get(email_id)
+
+    async def start(self) -> None:
+        """Requeue interrupted emails and start the dispatcher"""
+        requeued = self.store.requeue_interrupted()
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted email(s)")
+        self._wake = asyncio.Event()
+        self._start_dispatcher()
+
+    def _start_dispatcher(self) -> None:
+        """Create the dispatcher task"""
+        self._dispatcher = asyncio.create_task(self._dispatch())
+        self._dispatcher.add_done_callback(self._on_dispatcher_done)
+
+    def _on_dispatcher_done(self, task: asyncio.Task) -> None:
+        """Restart the dispatcher if it stopped for any reason other than shutdown"""
+        if task.cancelled() or task is not self._dispatcher:
+            return
+        error = task.exception()
+        logger.error(f"Email dispatcher stopped unexpectedly, restarting: {error!r}", exc_info=error)
+        self._start_dispatcher()
+
+    async def _dispatch(self) -> None:
+        """Run dispatch steps forever, pausing after errors instead of stopping"""
+        while True:
+            try:
+                await self._dispatch_once()
+            except Exception as e:
+                logger.error(
+                    f"Email dispatcher error, retrying in {DISPATCH_ERROR_DELAY}s: {str(e)}",
+                    exc_info=True
+                )
+                await asyncio.sleep(DISPATCH_ERROR_DELAY)
+
+    async def _dispatch_once(self) -> None:
+        """Claim due emails and start their sends, then wait if no more can start now"""
+        self._wake.clear()
+        free = self.concurrency - len(self._sends)
+        emails = self.store.claim_due(free) if free > 0 else []
+        for email in emails:
+            task = asyncio.create_task(self._deliver(email))
+            self._sends.add(task)
+            task.add_done_callback(self._on_send_done)
+
+        if emails and len(self._sends) < self.concurrency:
+            return
+
+        # Sleep until a send finishes, a new email arrives or the next retry is due
+        next_due = self.store.next_due_at()
+        timeout = IDLE_POLL_INTERVAL
+        if next_due is not None:
+            timeout = min(timeout, max(0.0, next_due - time.time()))
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _on_send_done(self, task: asyncio.Task) -> None:
+        """Forget a finished send and let the dispatcher fill its slot"""
+        self._sends.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # Only store errors get here; the email is requeued on the next start
+            logger.error(f"Email send task failed: {task.exception()!r}", exc_info=task.exception())
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _deliver(self, email: Dict[str, Any]) -> None:
+        """Send one email and record the outcome"""
+        await self.limiter.acquire()
+        payload = email["payload"]
+        attempts = email["attempts"] + 1
+        try:
+            if "batch_id" in payload:
+                result = await self._send_batch_member(email, payload["batch_id"])
+            else:
+                result = await email_service.send_content_email(
+                    to=email["recipient_email"],
+                    subject=email["subject"],
+                    content=payload["content"],
+                    topics=payload["topics"],
+                    content_types=payload["content_types"]
+                )
+        except Exception as e:
+            result = {"status": "error", "message": str(e), "retryable": True}
+
+        email_id = email["email_id"]
+        if result["status"] == "success":
+            self.store.mark_sent(email_id, attempts)
+            logger.info(f"Email {email_id} sent after {attempts} attempt(s)")
+            return
+
+        error = result["message"]
+        if not result.get("retryable", True) or attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            self.store.mark_failed(email_id, attempts, error)
+            logger.error(f"Email {email_id} failed after {attempts} attempt(s): {error}")
+            return
+
+        delay = self.retry_delay(attempts)
+        self.store.mark_retry(email_id, attempts, delay, error)
+        logger.warning(f"Email {email_id} attempt {attempts} failed, retrying in {delay:.1f}s: {error}")
+
+    async def _send_batch_member(self, email: Dict[str, Any], batch_id: str) -> Dict[str, Any]:
+        """Send a batch member with the bodies rendered for its batch"""
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            batch = self.store.get_batch(batch_id)
+            if batch is None:
+                return {"status": "error", "message": f"Batch {batch_id} not found", "retryable": False}
+            self._batches.set(batch_id, batch)
+
+        return await email_service.send_rendered_email(
+            to=email["recipient_email"],
+            subject=email["subject"],
+            html_body=batch["html_body"],
+            text_body=batch["text_body"]
+        )
+
+    @staticmethod
+    def retry_delay(attempts: int) -> float:
+        """
+        Backoff before the next attempt
+
+        Args:
+            attempts: Attempts made so far
+
+        Returns:
+            float: Seconds to wait (exponential with up to 20% jitter)
+        """
+        delay = min(settings.EMAIL_RETRY_MAX_DELAY, settings.EMAIL_RETRY_BASE_DELAY * 2 ** (attempts - 1))
+        return delay * random.uniform(0.8, 1.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get outbox state
+
+        Returns:
+            Dict: Emails by status, sends in progress, rate limiter usage and backend state
+        """
+        return {
+            "emails": self.store.count_by_status(),
+            "sending": len(self._sends),
+            "concurrency": self.concurrency,
+            "rate_limiter": self.limiter.stats(),
+            "backend": email_service.stats()
+        }
+
+    async def shutdown(self) -> None:
+        """Stop delivering (interrupted sends are retried on next start)"""
+        dispatcher, self._dispatcher = self._dispatcher, None
+        tasks = [dispatcher, *self._sends] if dispatcher else list(self._sends)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.store.close()
+
+
+# Create outbox instance
+email_outbox = EmailOutbox(outbox_store)
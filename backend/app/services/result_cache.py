@@ -0,0 +1,51 @@
+"""
+Result Cache
+Caches generated content for identical generation requests
+"""
+
+from typing import Any, Dict
+
+from app.config import settings
+from app.utils.cache import TTLCache, cache_store, make_cache_key
+from app.utils.helpers import normalize_text, split_content_types
+
+# Request fields that determine the generated content (email fields do not)
+FINGERPRINT_FIELDS = (
+    "business_goals",
+    "target_audience",
+    "timeline",
+    "brand_voice",
+    "additional_notes",
+    "profile"
+)
+
+result_cache = TTLCache(
+    namespace="result",
+    ttl=settings.RESULT_CACHE_TTL,
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+    disk_store=cache_store,
+    max_disk_entries=settings.RESULT_CACHE_MAX_DISK_ENTRIES
+)
+
+
+def request_fingerprint(request_data: Dict[str, Any]) -> str:
+    """
+    Build the cache key of a content generation request
+
+    Fields are compared case- and whitespace-insensitively, and the LLM
+    model and temperature are part of the key so a model change never
+    serves stale content.
+
+    Args:
+        request_data: Content generation parameters
+
+    Returns:
+        str: Request fingerprint
+    """
+    return make_cache_key(
+        [normalize_text(topic) for topic in request_data.get("content_topics", [])],
+        [normalize_text(content_type) for content_type in split_content_types(request_data.get("content_types", ""))],
+        {field: normalize_text(request_data.get(field)) for field in FINGERPRINT_FIELDS},
+        settings.LLM_MODEL,
+        settings.LLM_TEMPERATURE
+    )
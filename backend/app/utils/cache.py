@@ -0,0 +1,257 @@
+"""
+Cache Utilities
+Two-tier TTL cache: in-memory LRU in front of an optional SQLite tier
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+from app.db.base import SQLiteStore
+from app.utils.logger import setup_logger
+from app.utils.metrics import CACHE_LOOKUPS
+
+logger = setup_logger(__name__)
+
+# Prune expired and surplus disk entries every this many writes
+DISK_PRUNE_INTERVAL = 100
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from JSON-serializable parts
+
+    Args:
+        *parts: Values that identify the cached item
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    encoded = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CacheStore(SQLiteStore):
+    """
+    SQLite tier shared by all caches (entries are namespaced)
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    );
+    CREATE INDEX IF NOT EXISTS idx_cache_expiry ON cache_entries (namespace, expires_at);
+    """
+
+    def get(self, namespace: str, key: str) -> Optional[Tuple[Any, float]]:
+        """Get a live entry as (value, expires_at)"""
+        rows = self.execute(
+            "SELECT value, expires_at FROM cache_entries "
+            "WHERE namespace = ? AND key = ? AND expires_at > ?",
+            (namespace, key, time.time())
+        )
+        if not rows:
+            return None
+        return json.loads(rows[0]["value"]), rows[0]["expires_at"]
+
+    def set(self, namespace: str, key: str, value: Any, expires_at: float) -> None:
+        """Insert or replace an entry"""
+        self.execute(
+            "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (namespace, key, json.dumps(value), expires_at)
+        )
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Remove an entry"""
+        self.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+            (namespace, key)
+        )
+
+    def prune(self, namespace: str, max_entries: int) -> int:
+        """
+        Drop expired entries, then the soonest-expiring ones above max_entries
+
+        Returns:
+            int: Number of evicted (non-expired) entries
+        """
+        self.execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND expires_at <= ?",
+            (namespace, time.time())
+        )
+        count = self.execute(
+            "SELECT COUNT(*) AS n FROM cache_entries WHERE namespace = ?", (namespace,)
+        )[0]["n"]
+        surplus = count - max_entries
+        if surplus <= 0:
+            return 0
+        self.execute(
+            "DELETE FROM cache_entries WHERE rowid IN ("
+            "SELECT rowid FROM cache_entries WHERE namespace = ? "
+            "ORDER BY expires_at LIMIT ?)",
+            (namespace, surplus)
+        )
+        return surplus
+
+
+class TTLCache:
+    """
+    In-memory LRU cache with per-entry TTL and an optional disk tier
+
+    Values must be JSON-serializable when a disk tier is used. Memory
+    misses fall through to the disk tier, and disk hits are promoted back
+    into memory. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        max_entries: int,
+        disk_store: Optional[CacheStore] = None,
+        max_disk_entries: int = 10000
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            namespace: Name of the cache (separates entries in the disk tier)
+            ttl: Time to live in seconds
+            max_entries: Maximum in-memory entries before LRU eviction
+            disk_store: Optional SQLite tier
+            max_disk_entries: Maximum entries kept in the disk tier
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.disk_store = disk_store
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._hit_counter = CACHE_LOOKUPS.labels(cache=namespace, result="hit")
+        self._miss_counter = CACHE_LOOKUPS.labels(cache=namespace, result="miss")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    self._hit_counter.inc()
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+
+        if self.disk_store is not None:
+            try:
+                stored = self.disk_store.get(self.namespace, key)
+            except Exception as e:
+                logger.warning(f"Cache '{self.namespace}' disk read failed: {str(e)}")
+                stored = None
+            if stored is not None:
+                value, expires_at = stored
+                with self._lock:
+                    self._put(key, value, expires_at)
+                    self.hits += 1
+                    self.disk_hits += 1
+                self._hit_counter.inc()
+                return value
+
+        with self._lock:
+            self.misses += 1
+        self._miss_counter.inc()
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._put(key, value, expires_at)
+            self._disk_writes += 1
+            prune = self._disk_writes % DISK_PRUNE_INTERVAL == 0
+
+        if self.disk_store is not None:
+            try:
+                self.disk_store.set(self.namespace, key, value, expires_at)
+                if prune:
+                    evicted = self.disk_store.prune(self.namespace, self.max_disk_entries)
+                    with self._lock:
+                        self.evictions += evicted
+            except Exception as e:
+                logger.warning(f"Cache '{self.namespace}' disk write failed: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from both tiers
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.disk_store is not None:
+            self.disk_store.delete(self.namespace, key)
+
+    def _put(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert into the memory tier, evicting the least recently used entries (lock held)"""
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters
+
+        Returns:
+            Dict: Size, hits (and disk hits), misses, evictions and expirations
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+# Shared disk tier (None when disabled)
+cache_store: Optional[CacheStore] = (
+    CacheStore(settings.CACHE_STORE_PATH) if settings.CACHE_STORE_PATH else None
+)
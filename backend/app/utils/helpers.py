@@ -3,9 +3,10 @@ Helper Utilities
 Common utility functions used across the application
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import json
+import re
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
@@ -38,6 +39,19 @@ def sanitize_text(text: str) -> str:
     return text.strip()
 
 
+def normalize_text(text: Any) -> str:
+    """
+    Normalize free text for comparisons and cache keys
+    
+    Args:
+        text: Input text (None is treated as empty)
+        
+    Returns:
+        str: Lower-cased text with collapsed whitespace
+    """
+    return ' '.join(str(text or '').lower().split())
+
+
 def format_content_result(result: Any) -> Dict[str, Any]:
     """
     Format CrewAI result into a structured response
@@ -55,6 +69,41 @@ def format_content_result(result: Any) -> Dict[str, Any]:
     }
 
 
+def format_sse_event(event: Dict[str, Any]) -> str:
+    """
+    Format an event dict as a Server-Sent Events message
+    
+    Args:
+        event: Event payload (its `event` key becomes the SSE event name)
+        
+    Returns:
+        str: SSE message
+    """
+    name = event.get("event", "message")
+    return f"event: {name}\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+def split_content_types(content_types: str) -> List[str]:
+    """
+    Split a free-form content type list into individual types
+    
+    Args:
+        content_types: Comma or semicolon separated types
+            (e.g. "Blog posts, Social media posts")
+        
+    Returns:
+        List[str]: Distinct types in their original order
+    """
+    types = []
+    seen = set()
+    for part in re.split(r"[,;\n]", content_types or ""):
+        content_type = part.strip()
+        if content_type and content_type.lower() not in seen:
+            seen.add(content_type.lower())
+            types.append(content_type)
+    return types
+
+
 def validate_topics(topics: list) -> bool:
     """
     Validate content topics
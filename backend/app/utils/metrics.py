@@ -0,0 +1,169 @@
+"""
+Metrics Utilities
+Prometheus metrics and the timing helpers used to record them
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest
+)
+
+# Dedicated registry, so only application metrics are exported
+registry = CollectorRegistry(auto_describe=True)
+
+# Crew runs take minutes, HTTP requests and searches take milliseconds to seconds
+FAST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SLOW_BUCKETS = (1, 2.5, 5, 10, 20, 30, 60, 90, 120, 180, 300, 600)
+
+REQUEST_LATENCY = Histogram(
+    "contentpilot_http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "route", "status"],
+    buckets=FAST_BUCKETS + (60, 120, 300, 600),
+    registry=registry
+)
+
+STAGE_DURATION = Histogram(
+    "contentpilot_crew_stage_duration_seconds",
+    "Duration of each crew stage",
+    ["stage", "profile"],
+    buckets=SLOW_BUCKETS,
+    registry=registry
+)
+
+SEARCH_DURATION = Histogram(
+    "contentpilot_search_duration_seconds",
+    "Duration of web searches by where the results came from",
+    ["source"],
+    buckets=FAST_BUCKETS,
+    registry=registry
+)
+
+TOOL_CALL_DURATION = Histogram(
+    "contentpilot_tool_call_duration_seconds",
+    "Duration of agent tool calls",
+    ["tool", "outcome"],
+    buckets=FAST_BUCKETS,
+    registry=registry
+)
+
+LLM_TOKENS = Counter(
+    "contentpilot_llm_tokens_total",
+    "LLM tokens used by crew runs",
+    ["kind", "profile"],
+    registry=registry
+)
+
+CACHE_LOOKUPS = Counter(
+    "contentpilot_cache_lookups_total",
+    "Cache lookups by cache and result",
+    ["cache", "result"],
+    registry=registry
+)
+
+EMAIL_SENDS = Counter(
+    "contentpilot_email_sends_total",
+    "Emails sent by outcome",
+    ["status"],
+    registry=registry
+)
+
+EMAIL_SEND_DURATION = Histogram(
+    "contentpilot_email_send_duration_seconds",
+    "Duration of email rendering and delivery",
+    ["status"],
+    buckets=FAST_BUCKETS,
+    registry=registry
+)
+
+GENERATIONS_IN_FLIGHT = Gauge(
+    "contentpilot_generations_in_flight",
+    "Crew runs currently executing or waiting for a worker",
+    registry=registry
+)
+
+STARTUP_DURATION = Gauge(
+    "contentpilot_startup_duration_seconds",
+    "Seconds from app import to readiness, and per background warm-up step",
+    ["phase"],
+    registry=registry
+)
+
+
+class Timer:
+    """
+    Measures one timed block
+
+    Set `labels` inside the block to choose the recorded label values
+    after the outcome is known.
+    """
+
+    __slots__ = ("started_at", "labels")
+
+    def __init__(self, **labels: Any):
+        """Start timing"""
+        self.started_at = time.perf_counter()
+        self.labels = labels
+
+    def elapsed(self) -> float:
+        """Seconds since the block started"""
+        return time.perf_counter() - self.started_at
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels: Any) -> Iterator[Timer]:
+    """
+    Record the duration of a block in a histogram
+
+    The block's duration is observed even if it raises. Labels may be
+    changed through the yielded Timer before the block ends.
+
+    Args:
+        histogram: Histogram to record into
+        **labels: Initial label values
+
+    Yields:
+        Timer: The running timer
+    """
+    timer = Timer(**labels)
+    try:
+        yield timer
+    finally:
+        histogram.labels(**timer.labels).observe(timer.elapsed())
+
+
+def record_token_usage(usage: Any, profile: str) -> None:
+    """
+    Count the tokens reported by a crew kickoff
+
+    Args:
+        usage: CrewAI UsageMetrics (or None)
+        profile: Pipeline profile of the run
+    """
+    if usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+    if prompt_tokens:
+        LLM_TOKENS.labels(kind="prompt", profile=profile).inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(kind="completion", profile=profile).inc(completion_tokens)
+
+
+def render_metrics() -> bytes:
+    """
+    Render all metrics in the Prometheus text format
+
+    Returns:
+        bytes: Exposition payload (served with CONTENT_TYPE_LATEST)
+    """
+    return generate_latest(registry)
+
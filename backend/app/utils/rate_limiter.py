@@ -0,0 +1,90 @@
+"""
+Rate Limiter
+Async token bucket used to keep outgoing calls within provider quotas
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket for asyncio tasks
+
+    Allows `rate` acquisitions per second on average, with bursts of up
+    to `burst`. Waiters are served in arrival order.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1):
+        """
+        Initialize the limiter (starts with a full bucket)
+
+        Args:
+            name: Limiter name, used in logs and stats
+            rate: Sustained acquisitions per second (0 or less disables limiting)
+            burst: Maximum acquisitions allowed back to back
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock: asyncio.Lock = None
+        self.acquired = 0
+        self.waited = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Wait until a call is allowed
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if self.rate <= 0:
+            self.acquired += 1
+            return 0.0
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        waited = 0.0
+        # Holding the lock while sleeping keeps waiters in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited = delay
+                self._refill()
+            self._tokens -= 1
+
+        self.acquired += 1
+        self.waited += waited
+        if waited > 1:
+            logger.debug(f"Rate limiter '{self.name}' delayed a call by {waited:.2f}s")
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter usage
+
+        Returns:
+            Dict: Rate, burst, acquisitions and total seconds waited
+        """
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": round(self.waited, 3)
+        }
@@ -0,0 +1,88 @@
+"""
+Single-Flight Utilities
+Coalesces identical concurrent async calls into one execution
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from app.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time
+
+    Callers that arrive while a call with the same key is in flight wait
+    for that call and receive its result (or exception) instead of
+    starting their own. The shared call is cancelled only once every
+    waiting caller has been cancelled. Must be used from one event loop.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialize the group
+
+        Args:
+            name: Name used in logs
+        """
+        self.name = name
+        self._flights: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, or join the in-flight call with the same key
+
+        Args:
+            key: Identity of the call
+            call: Zero-argument coroutine function performing the work
+
+        Returns:
+            Any: Result of the (possibly shared) call
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(call())
+            self._flights[key] = flight
+            self._waiters[key] = 0
+            flight.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"{self.name}: joined in-flight call ({self._waiters[key]} waiting)")
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(flight)
+        except asyncio.CancelledError:
+            # Only stop the shared call when nobody is left waiting for it
+            if self._flights.get(key) is flight and self._waiters[key] == 1:
+                flight.cancel()
+            raise
+        finally:
+            if self._flights.get(key) is flight:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: str, flight: asyncio.Task) -> None:
+        """Remove a finished call so later callers start a new one"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+            del self._waiters[key]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters
+
+        Returns:
+            Dict: In-flight, started and coalesced call counts
+        """
+        return {
+            "in_flight": len(self._flights),
+            "started": self.started,
+            "coalesced": self.coalesced
+        }
@@ -0,0 +1,98 @@
+"""
+Startup Utilities
+Measures cold start and runs slow initialization in the background
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.utils.logger import setup_logger
+from app.utils.metrics import STARTUP_DURATION
+
+logger = setup_logger(__name__)
+
+
+class StartupTracker:
+    """
+    Tracks how long the app takes to become ready and to warm up
+
+    The clock starts when this module is imported, which app.main does
+    before importing anything heavy. Readiness is marked once startup
+    hooks have run; warm-up steps (crew construction, Gmail auth) then
+    run on a background thread, and anything they have not finished yet
+    is initialized by the first request that needs it.
+    """
+
+    def __init__(self):
+        """Start the startup clock"""
+        self.started_at = time.perf_counter()
+        self.ready_after: Optional[float] = None
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def mark_ready(self) -> float:
+        """
+        Record that the app is ready to serve requests
+
+        Returns:
+            float: Seconds since the clock started
+        """
+        self.ready_after = time.perf_counter() - self.started_at
+        STARTUP_DURATION.labels(phase="ready").set(self.ready_after)
+        logger.info(f"Ready to serve after {self.ready_after:.2f}s")
+        return self.ready_after
+
+    def warm_up(self, steps: Dict[str, Callable[[], Any]]) -> None:
+        """
+        Run warm-up steps in order on a background thread
+
+        A failing step is logged and recorded; it does not stop the
+        remaining steps or affect readiness.
+
+        Args:
+            steps: Callables by step name
+        """
+        for name in steps:
+            self.steps[name] = {"status": "pending"}
+        self._thread = threading.Thread(
+            target=self._run_steps,
+            args=(steps,),
+            name="warm-up",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run_steps(self, steps: Dict[str, Callable[[], Any]]) -> None:
+        """Background warm-up job"""
+        for name, step in steps.items():
+            self.steps[name] = {"status": "running"}
+            started_at = time.perf_counter()
+            try:
+                step()
+                status, error = "done", None
+            except Exception as e:
+                status, error = "failed", str(e)
+                logger.warning(f"Warm-up step '{name}' failed: {error}")
+            duration = time.perf_counter() - started_at
+            self.steps[name] = {"status": status, "duration": round(duration, 3)}
+            if error:
+                self.steps[name]["error"] = error
+            STARTUP_DURATION.labels(phase=f"warm_up.{name}").set(duration)
+            logger.info(f"Warm-up step '{name}' {status} in {duration:.2f}s")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get startup timings
+
+        Returns:
+            Dict: Seconds until ready and the status of each warm-up step
+        """
+        return {
+            "ready_after": round(self.ready_after, 3) if self.ready_after is not None else None,
+            "warm_up": dict(self.steps)
+        }
+
+
+# Created on import so the clock starts as early as possible
+startup_tracker = StartupTracker()
@@ -0,0 +1,183 @@
+"""
+Hot Path Benchmarks
+Per-request CPU work outside the crew: validation, formatting, email rendering and serialization
+
+Usage (from the backend folder):
+    python -m benchmarks.bench_hot_paths [--min-time 1.0] [--filter email]
+    python -m benchmarks.bench_hot_paths --save-baseline
+
+Exits with status 1 if a case regresses beyond --tolerance against the
+stored baseline (benchmarks/baselines/hot_paths.json), or if a full run
+is missing a baseline case. Baselines are machine-specific: refresh them
+on the machine that runs the comparison.
+"""
+
+import argparse
+import base64
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List
+
+# Nothing here calls the APIs, placeholder keys are enough
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from app.models.requests import ContentGenerationRequest  # noqa: E402
+from app.models.responses import ContentGenerationResponse  # noqa: E402
+from app.services.email_renderer import EmailRenderer, TTLCache  # noqa: E402
+from app.services.email_service import EmailService  # noqa: E402
+from app.utils.helpers import format_content_result, format_sse_event  # noqa: E402
+from benchmarks.harness import load_baseline, report, run_benchmark, save_baseline  # noqa: E402
+
+SUITE = "hot_paths"
+
+REQUEST_BODY = {
+    "content_topics": ["Eco-Friendly Travel", "Sustainable Tourism", "Green Hotels"],
+    "business_goals": "Increase brand awareness and drive more eco-tour bookings",
+    "target_audience": "Environmentally conscious travelers aged 25-45",
+    "timeline": "Weekly for one month",
+    "content_types": "Blog posts, Social media posts, Newsletter",
+    "brand_voice": "Friendly and helpful",
+    "additional_notes": "Focus on budget-friendly options",
+    "send_email": True,
+    "recipient_email": "Client@Example.com",
+    "email_subject": "Your AI-Generated Content from ContentPilot"
+}
+
+
+def make_document(sections: int) -> str:
+    """
+    Build a markdown document shaped like crew output
+
+    Args:
+        sections: Number of content pieces (each roughly 2.5 KiB)
+
+    Returns:
+        str: Markdown text
+    """
+    parts = []
+    for i in range(sections):
+        parts.append(
+            f"## Blog Post {i + 1}: Sustainable Travel on a Budget\n\n"
+            "Traveling sustainably does not have to be expensive. **Small choices** add up, "
+            "and *local* experiences are often the most memorable. Here is how to start.\n\n"
+            "### Key Takeaways\n\n"
+            "- Choose trains over short-haul flights where possible\n"
+            "- Stay in certified eco-lodges or locally owned guesthouses\n"
+            "- Pack light: every kilogram counts on the way there and back\n"
+            "- Eat seasonal food from local markets\n\n"
+            "1. Plan your route around public transport\n"
+            "2. Book experiences run by local guides\n"
+            "3. Offset what you cannot avoid\n\n"
+            "| Option | Cost | CO2 per trip |\n"
+            "|--------|------|--------------|\n"
+            "| Train | $120 | 14 kg |\n"
+            "| Flight | $90 | 160 kg |\n"
+            "| Bus | $45 | 27 kg |\n\n"
+            "```\nTip: search 'eco-certified' when booking stays\n```\n\n"
+            "> The greenest trip is the one that leaves the place better than you found it.\n\n"
+            + "Sustainable tourism supports local economies and protects the places we love. "
+            * 12
+            + "\n\n**Call to action:** Share your favourite green getaway in the comments!\n"
+        )
+    return "\n---\n\n".join(parts)
+
+
+def build_cases() -> Dict[str, Callable[[], Any]]:
+    """
+    Build the benchmark cases
+
+    Returns:
+        Dict: Callables by case name
+    """
+    topics = REQUEST_BODY["content_topics"]
+    content_types = REQUEST_BODY["content_types"]
+    small_doc = make_document(3)
+    large_doc = make_document(40)
+
+    formatted = format_content_result(large_doc)
+    formatted["topics"] = topics
+    formatted["run_stats"] = {
+        "profile": "standard",
+        "duration": 84.2,
+        "stage_durations": {"researcher": 41.5, "planner": 18.3, "writer": 24.4},
+        "tool_calls": {"researcher": 4, "planner": 1},
+        "searches": 4,
+        "memo_hits": 1
+    }
+    response = ContentGenerationResponse(**formatted)
+    token_event = {"event": "token", "stage": "writer", "elapsed": 12.5, "delta": "sustainable "}
+
+    # Uncached renders measure the markdown conversion itself
+    cold = EmailRenderer(cache=None)
+    cached = EmailRenderer(cache=TTLCache("bench_email_render", ttl=3600, max_entries=8))
+    html_body, text_body = cold.render(large_doc, topics, content_types)
+    email_service = EmailService()
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "request validation": lambda: ContentGenerationRequest(**REQUEST_BODY),
+        "request validation + model_dump": lambda: ContentGenerationRequest(**REQUEST_BODY).model_dump(),
+        "format_content_result (100 KiB)": lambda: format_content_result(large_doc),
+        "response model_dump_json (100 KiB)": response.model_dump_json,
+        "response JSONResponse render (100 KiB)": lambda: JSONResponse(jsonable_encoder(response)).body,
+        "response json.dumps (100 KiB)": lambda: json.dumps(formatted),
+        "format_sse_event (token)": lambda: format_sse_event(token_event),
+        "email html render (7 KiB)": lambda: cold.render_html(small_doc, topics, content_types),
+        "email html render (100 KiB)": lambda: cold.render_html(large_doc, topics, content_types),
+        "email text render (100 KiB)": lambda: cold.render_text(large_doc, topics, content_types),
+        "email html + text render, cached (100 KiB)": lambda: cached.render(large_doc, topics, content_types),
+        # Same work as the Gmail backend does per message before the API call
+        "email MIME build + base64 (100 KiB)": lambda: base64.urlsafe_b64encode(
+            email_service._build_message(
+                "client@example.com", REQUEST_BODY["email_subject"], html_body, text_body
+            ).as_bytes()
+        ),
+    }
+    return cases
+
+
+def main() -> None:
+    """Run the suite, print results and compare them with the baseline"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds to spend per case")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    args = parser.parse_args()
+
+    results = [
+        run_benchmark(name, fn, args.min_time)
+        for name, fn in build_cases().items()
+        if args.filter.lower() in name.lower()
+    ]
+
+    if args.save_baseline:
+        # A full run replaces the baseline, so renamed or removed cases do not linger
+        path = save_baseline(SUITE, results, replace=not args.filter)
+        report(results, {}, args.tolerance)
+        print(f"\nBaseline saved to {path}")
+        return
+
+    baseline = load_baseline(SUITE)
+    regressions: List[str] = report(results, baseline, args.tolerance)
+    failed = bool(regressions)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+
+    if not args.filter:
+        ran = {result.name for result in results}
+        missing = [name for name in baseline if name not in ran]
+        if missing:
+            print(f"\n{len(missing)} baseline case(s) did not run: {', '.join(missing)}")
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
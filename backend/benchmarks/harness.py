@@ -0,0 +1,191 @@
+"""
+Benchmark Harness
+Measures throughput and allocations of hot-path callables and compares them to stored baselines
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+class BenchmarkResult:
+    """
+    Outcome of one benchmark case
+    """
+
+    def __init__(self, name: str, ops_per_sec: float, mean_us: float, alloc_kib: float, alloc_blocks: int):
+        """Initialize the result"""
+        self.name = name
+        self.ops_per_sec = ops_per_sec
+        self.mean_us = mean_us
+        self.alloc_kib = alloc_kib
+        self.alloc_blocks = alloc_blocks
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to a baseline entry"""
+        return {
+            "ops_per_sec": round(self.ops_per_sec, 1),
+            "mean_us": round(self.mean_us, 2),
+            "alloc_kib": round(self.alloc_kib, 2),
+            "alloc_blocks": self.alloc_blocks
+        }
+
+
+def measure_allocations(fn: Callable[[], Any], samples: int = 5) -> Dict[str, float]:
+    """
+    Measure memory allocated while a callable runs
+
+    Args:
+        fn: Callable to measure
+        samples: Calls to average over
+
+    Returns:
+        Dict: Peak KiB allocated per call and memory blocks still held
+            right after the call (before its result is released)
+    """
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            gc.collect()
+            before, _ = tracemalloc.get_traced_memory()
+            before_blocks = len(tracemalloc.take_snapshot().traces)
+            tracemalloc.reset_peak()
+            result = fn()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+            blocks.append(len(tracemalloc.take_snapshot().traces) - before_blocks)
+            del result
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_kib": sum(peaks) / len(peaks) / 1024,
+        "alloc_blocks": max(0, round(sum(blocks) / len(blocks)))
+    }
+
+
+def run_benchmark(name: str, fn: Callable[[], Any], min_time: float = 1.0) -> BenchmarkResult:
+    """
+    Run a benchmark case
+
+    The callable is warmed up, then called in growing batches until
+    `min_time` seconds have been spent; allocations are measured in a
+    separate pass so tracing does not skew the timings.
+
+    Args:
+        name: Case name
+        fn: Callable to benchmark
+        min_time: Minimum timed duration in seconds
+
+    Returns:
+        BenchmarkResult: Throughput and allocation figures
+    """
+    for _ in range(3):
+        fn()
+
+    calls = 0
+    elapsed = 0.0
+    batch = 1
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        while elapsed < min_time:
+            started_at = time.perf_counter()
+            for _ in range(batch):
+                fn()
+            elapsed += time.perf_counter() - started_at
+            calls += batch
+            batch = min(batch * 2, 10000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    allocations = measure_allocations(fn)
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=calls / elapsed,
+        mean_us=elapsed / calls * 1e6,
+        alloc_kib=allocations["alloc_kib"],
+        alloc_blocks=allocations["alloc_blocks"]
+    )
+
+
+def load_baseline(suite: str) -> Dict[str, Dict[str, float]]:
+    """
+    Load the stored baseline of a suite
+
+    Args:
+        suite: Suite name
+
+    Returns:
+        Dict: Baseline entries by case name (empty if none is stored)
+    """
+    path = BASELINE_DIR / f"{suite}.json"
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(suite: str, results: List[BenchmarkResult], replace: bool = False) -> Path:
+    """
+    Store results in the suite's baseline
+
+    Args:
+        suite: Suite name
+        results: Benchmark results
+        replace: Drop entries of cases not in `results` (otherwise they are kept)
+
+    Returns:
+        Path: Baseline file
+    """
+    baseline = {} if replace else load_baseline(suite)
+    baseline.update({r.name: r.to_dict() for r in results})
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{suite}.json"
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+    return path
+
+
+def report(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float
+) -> List[str]:
+    """
+    Print a results table and compare it with the baseline
+
+    A case regresses when its throughput drops, or its allocations grow,
+    by more than `tolerance` (a fraction) relative to the baseline.
+
+    Args:
+        results: Benchmark results
+        baseline: Baseline entries by case name
+        tolerance: Allowed relative regression
+
+    Returns:
+        List[str]: Names of regressed cases
+    """
+    regressions = []
+    print(f"\n{'case':<44}{'ops/sec':>12}{'mean us':>12}{'alloc KiB':>12}{'blocks':>8}{'vs base':>10}")
+    for result in results:
+        base: Optional[Dict[str, float]] = baseline.get(result.name)
+        change = ""
+        if base:
+            ratio = result.ops_per_sec / base["ops_per_sec"]
+            change = f"{(ratio - 1) * 100:+.1f}%"
+            slower = ratio < 1 - tolerance
+            heavier = result.alloc_kib > base["alloc_kib"] * (1 + tolerance) + 1
+            if slower or heavier:
+                regressions.append(result.name)
+                change += " !"
+        print(
+            f"{result.name:<44}{result.ops_per_sec:>12.1f}{result.mean_us:>12.2f}"
+            f"{result.alloc_kib:>12.2f}{result.alloc_blocks:>8}{change:>10}"
+        )
+    return regressions
@@ -0,0 +1,469 @@
+"""
+End-to-End Load Test
+Runs the API against local stand-in servers and drives concurrent generation and email traffic
+
+Usage (from the backend folder):
+    python -m benchmarks.load_test [--concurrency 8] [--generate 40] [--send-email 40]
+    python -m benchmarks.load_test --llm-latency 1.5 --llm-tokens-per-sec 80 --profile fast
+    python -m benchmarks.load_test --generate 0 --email-backend smtp --smtp-handshake-latency 0.3
+    python -m benchmarks.load_test --generate 0 --send-email 0 --bulk-recipients 200
+
+The app is started with uvicorn in a subprocess. Gemini, Tavily, Gmail
+and the SMTP relay are replaced by the servers in benchmarks/stubs.py, so no API keys or
+network access are needed and results reflect the app's own overhead
+plus the configured stand-in latencies. Emails are queued by the API, so
+after the load the harness also waits for the outbox to deliver them and
+reports delivery latency (queued to sent). Exits with status 1 if the
+error rate exceeds --max-error-rate.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.stubs import StubGemini, StubGmail, StubSMTP, StubTavily
+
+BACKEND_DIR = Path(__file__).parent.parent
+API_PREFIX = "/api/v1/content"
+
+GENERATE_BODY = {
+    "content_topics": ["Eco-Friendly Travel", "Sustainable Tourism"],
+    "business_goals": "Increase brand awareness and drive more eco-tour bookings",
+    "target_audience": "Environmentally conscious travelers aged 25-45",
+    "timeline": "Weekly for one month",
+    "content_types": "Blog posts, Social media posts",
+    "brand_voice": "Friendly and helpful",
+    "send_email": False
+}
+
+EMAIL_BODY = {
+    "recipient_email": "load-test@example.com",
+    "subject": "Your AI-Generated Content from ContentPilot",
+    "content": "## Blog Post: Eco-Friendly Travel\n\n" + "Sustainable travel on a budget. " * 80,
+    "topics": ["Eco-Friendly Travel"],
+    "content_types": "Blog posts"
+}
+
+
+class Sample:
+    """
+    Outcome of one request
+    """
+
+    __slots__ = ("endpoint", "latency", "status", "error", "email_id")
+
+    def __init__(self, endpoint: str, latency: float, status: int, error: Optional[str] = None,
+                 email_id: Optional[str] = None):
+        """Initialize the sample"""
+        self.endpoint = endpoint
+        self.latency = latency
+        self.status = status
+        self.error = error
+        self.email_id = email_id
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded"""
+        return self.error is None and 200 <= self.status < 300
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Sorted values
+        pct: Percentile (0-100)
+
+    Returns:
+        float: The percentile (0 if there are no values)
+    """
+    if not values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(values) + 0.5))
+    return values[min(rank, len(values)) - 1]
+
+
+def write_gmail_token(directory: str) -> str:
+    """
+    Write an unexpired placeholder OAuth token so the email service starts
+    without an OAuth flow (the stand-in Gmail server ignores it)
+
+    Args:
+        directory: Folder to write into
+
+    Returns:
+        str: Token file path
+    """
+    path = Path(directory) / "token.json"
+    expiry = datetime.now(timezone.utc) + timedelta(days=1)
+    path.write_text(json.dumps({
+        "token": "load-test",
+        "refresh_token": "load-test",
+        "token_uri": "https://oauth2.googleapis.com/token",
+        "client_id": "load-test",
+        "client_secret": "load-test",
+        "scopes": ["https://www.googleapis.com/auth/gmail.send"],
+        "expiry": expiry.strftime("%Y-%m-%dT%H:%M:%SZ")
+    }))
+    return str(path)
+
+
+def app_environment(args: argparse.Namespace, gemini: StubGemini, tavily: StubTavily,
+                    gmail: StubGmail, smtp: StubSMTP, workdir: str) -> Dict[str, str]:
+    """
+    Build the environment of the app under test
+
+    Args:
+        args: Parsed command line
+        gemini: Stand-in Gemini server
+        tavily: Stand-in Tavily server
+        gmail: Stand-in Gmail server
+        smtp: Stand-in SMTP relay
+        workdir: Scratch folder for tokens and stores
+
+    Returns:
+        Dict: Environment variables
+    """
+    env = dict(os.environ)
+    env.update({
+        "GOOGLE_API_KEY": "load-test",
+        "TAVILY_API_KEY": "load-test",
+        "GOOGLE_GEMINI_BASE_URL": gemini.url,
+        "TAVILY_API_URL": tavily.url,
+        "GMAIL_API_ENDPOINT": gmail.url,
+        "GMAIL_TOKEN_PATH": write_gmail_token(workdir),
+        "EMAIL_BACKEND": args.email_backend,
+        "SMTP_SERVER": "127.0.0.1",
+        "SMTP_PORT": str(smtp.port),
+        "SMTP_USER": smtp.username,
+        "SMTP_PASSWORD": smtp.password,
+        "FROM_EMAIL": "contentpilot@example.com",
+        "JOB_STORE_PATH": str(Path(workdir) / "jobs.db"),
+        "EMAIL_OUTBOX_PATH": str(Path(workdir) / "outbox.db"),
+        "CACHE_STORE_PATH": "",
+        "LOG_LEVEL": "WARNING",
+        "CREW_MAX_CONCURRENCY": str(args.crew_concurrency),
+        # Keep crewai from reaching out to its telemetry endpoint
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        "OTEL_SDK_DISABLED": "true"
+    })
+    if args.email_send_rate is not None:
+        env["EMAIL_SEND_RATE"] = str(args.email_send_rate)
+    return env
+
+
+def start_app(env: Dict[str, str], port: int, timeout: float,
+              show_output: bool = False) -> "tuple[subprocess.Popen, float]":
+    """
+    Start the app with uvicorn and wait until it answers health checks
+
+    Args:
+        env: Environment of the app
+        port: Port to serve on
+        timeout: Seconds to wait for startup
+        show_output: Keep the app's stdout (verbose crew logs); stderr is always shown
+
+    Returns:
+        Tuple: The process and its startup time in seconds
+
+    Raises:
+        RuntimeError: If the app exits or does not become healthy in time
+    """
+    started_at = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=None if show_output else subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}/health"
+    while time.perf_counter() - started_at < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited during startup with status {process.returncode}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return process, time.perf_counter() - started_at
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"App did not become healthy within {timeout:.0f}s")
+
+
+async def send(client: httpx.AsyncClient, endpoint: str, body: Dict[str, Any]) -> Sample:
+    """
+    Send one request and time it
+
+    Args:
+        client: HTTP client bound to the app
+        endpoint: Path below the content API
+        body: JSON body
+
+    Returns:
+        Sample: The outcome
+    """
+    started_at = time.perf_counter()
+    try:
+        response = await client.post(f"{API_PREFIX}{endpoint}", json=body)
+        latency = time.perf_counter() - started_at
+        if not response.is_success:
+            return Sample(endpoint, latency, response.status_code, response.text[:200])
+        email_id = response.json().get("email_id") if endpoint == "/send-email" else None
+        return Sample(endpoint, latency, response.status_code, email_id=email_id)
+    except httpx.HTTPError as e:
+        return Sample(endpoint, time.perf_counter() - started_at, 0, f"{type(e).__name__}: {e}")
+
+
+async def send_bulk(base_url: str, recipients: int, timeout: float) -> "tuple[Sample, List[str]]":
+    """
+    Send the email body to many recipients with one bulk request
+
+    Args:
+        base_url: App URL
+        recipients: Number of recipients
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple: The request's sample and the queued email ids
+    """
+    body = {k: v for k, v in EMAIL_BODY.items() if k != "recipient_email"}
+    body["recipient_emails"] = [f"load-test-{i}@example.com" for i in range(recipients)]
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        started_at = time.perf_counter()
+        try:
+            response = await client.post(f"{API_PREFIX}/send-email/bulk", json=body)
+        except httpx.HTTPError as e:
+            return Sample("/send-email/bulk", time.perf_counter() - started_at, 0, f"{type(e).__name__}: {e}"), []
+        latency = time.perf_counter() - started_at
+        if not response.is_success:
+            return Sample("/send-email/bulk", latency, response.status_code, response.text[:200]), []
+        email_ids = [r["email_id"] for r in response.json()["recipients"]]
+        return Sample("/send-email/bulk", latency, response.status_code), email_ids
+
+
+def build_requests(args: argparse.Namespace) -> List["tuple[str, Dict[str, Any]]"]:
+    """
+    Build the request mix, interleaving generation and email requests
+
+    Each generation brief gets its own topic suffix, so caches and request
+    coalescing do not short-circuit the runs (unless --same-brief is set).
+
+    Args:
+        args: Parsed command line
+
+    Returns:
+        List: (endpoint, body) pairs in send order
+    """
+    generate = []
+    for i in range(args.generate):
+        body = dict(GENERATE_BODY, profile=args.profile)
+        if not args.same_brief:
+            body["content_topics"] = [f"{topic} #{i}" for topic in GENERATE_BODY["content_topics"]]
+        generate.append(("/generate", body))
+    emails = [("/send-email", EMAIL_BODY) for _ in range(args.send_email)]
+
+    mixed = []
+    while generate or emails:
+        if generate:
+            mixed.append(generate.pop(0))
+        if emails:
+            mixed.append(emails.pop(0))
+    return mixed
+
+
+async def drive(base_url: str, requests: List["tuple[str, Dict[str, Any]]"],
+                concurrency: int, timeout: float) -> "tuple[List[Sample], float]":
+    """
+    Send requests with a fixed number of concurrent clients
+
+    Args:
+        base_url: App URL
+        requests: (endpoint, body) pairs
+        concurrency: Requests in flight at once
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Tuple: Samples and wall-clock duration in seconds
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in requests:
+        queue.put_nowait(item)
+    samples: List[Sample] = []
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            endpoint, body = queue.get_nowait()
+            samples.append(await send(client, endpoint, body))
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return samples, time.perf_counter() - started_at
+
+
+async def collect_deliveries(base_url: str, email_ids: List[str],
+                             timeout: float) -> "tuple[List[Sample], float]":
+    """
+    Wait for queued emails to be delivered and measure queued-to-sent latency
+
+    Args:
+        base_url: App URL
+        email_ids: Outbox ids returned by /send-email
+        timeout: Seconds to wait for the outbox to drain
+
+    Returns:
+        Tuple: One sample per email and the delivery span in seconds
+            (first email queued to last email sent)
+    """
+    pending = set(email_ids)
+    emails: Dict[str, Dict[str, Any]] = {}
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url, timeout=10.0) as client:
+        while pending and time.perf_counter() < deadline:
+            for email_id in list(pending):
+                response = await client.get(f"{API_PREFIX}/emails/{email_id}")
+                email = response.json()
+                if email.get("status") in ("sent", "failed"):
+                    emails[email_id] = email
+                    pending.discard(email_id)
+            if pending:
+                await asyncio.sleep(0.5)
+
+    samples = []
+    first_queued, last_sent = None, None
+    for email_id in email_ids:
+        email = emails.get(email_id)
+        if email is None:
+            samples.append(Sample("delivery", timeout, 0, f"Not delivered within {timeout:.0f}s"))
+            continue
+        queued_at = datetime.fromisoformat(email["created_at"])
+        first_queued = min(first_queued or queued_at, queued_at)
+        if email["status"] == "failed":
+            samples.append(Sample("delivery", 0.0, 0, email["last_error"]))
+            continue
+        sent_at = datetime.fromisoformat(email["sent_at"])
+        last_sent = max(last_sent or sent_at, sent_at)
+        samples.append(Sample("delivery", (sent_at - queued_at).total_seconds(), 200))
+
+    span = (last_sent - first_queued).total_seconds() if first_queued and last_sent else timeout
+    return samples, max(span, 1e-3)
+
+
+def report(samples: List[Sample], duration: float) -> float:
+    """
+    Print throughput, latency percentiles and error rates per endpoint
+
+    Args:
+        samples: Request outcomes
+        duration: Wall-clock duration of the run in seconds
+
+    Returns:
+        float: Overall error rate
+    """
+    print(f"\n{'endpoint':<18}{'requests':>10}{'errors':>8}{'err %':>8}{'req/s':>9}"
+          f"{'p50 s':>9}{'p95 s':>9}{'p99 s':>9}{'max s':>9}")
+    endpoints = sorted({s.endpoint for s in samples})
+    for endpoint in endpoints + ["all"]:
+        group = [s for s in samples if endpoint in ("all", s.endpoint)]
+        if not group:
+            continue
+        latencies = sorted(s.latency for s in group)
+        errors = sum(1 for s in group if not s.ok)
+        print(
+            f"{endpoint:<18}{len(group):>10}{errors:>8}{errors / len(group) * 100:>8.1f}"
+            f"{len(group) / duration:>9.2f}{percentile(latencies, 50):>9.3f}"
+            f"{percentile(latencies, 95):>9.3f}{percentile(latencies, 99):>9.3f}{latencies[-1]:>9.3f}"
+        )
+
+    failures = [s for s in samples if not s.ok]
+    for sample in failures[:5]:
+        print(f"  {sample.endpoint} -> {sample.status}: {sample.error}")
+    return len(failures) / len(samples) if samples else 0.0
+
+
+def main() -> None:
+    """Start the stand-ins and the app, run the load and print the report"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--generate", type=int, default=16, help="Number of /generate requests")
+    parser.add_argument("--send-email", type=int, default=32, help="Number of /send-email requests")
+    parser.add_argument("--bulk-recipients", type=int, default=0,
+                        help="Recipients of one /send-email/bulk request sent after the load (0 skips it)")
+    parser.add_argument("--profile", default="fast", choices=["fast", "standard", "deep"])
+    parser.add_argument("--same-brief", action="store_true", help="Send one identical brief (exercises caches)")
+    parser.add_argument("--crew-concurrency", type=int, default=4, help="CREW_MAX_CONCURRENCY of the app")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Stand-in LLM time to first token (s)")
+    parser.add_argument("--llm-tokens-per-sec", type=float, default=200.0, help="Stand-in LLM output rate")
+    parser.add_argument("--llm-output-tokens", type=int, default=300, help="Tokens per stand-in LLM answer")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="Stand-in Tavily latency (s)")
+    parser.add_argument("--email-backend", default="gmail", choices=["gmail", "smtp"], help="EMAIL_BACKEND of the app")
+    parser.add_argument("--gmail-latency", type=float, default=0.2, help="Stand-in Gmail latency (s)")
+    parser.add_argument("--smtp-latency", type=float, default=0.05, help="Stand-in SMTP latency per message (s)")
+    parser.add_argument("--smtp-handshake-latency", type=float, default=0.3,
+                        help="Stand-in SMTP connect, TLS and login time per connection (s)")
+    parser.add_argument("--email-send-rate", type=float, help="EMAIL_SEND_RATE of the app (default: app setting)")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the app under test")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout (s)")
+    parser.add_argument("--startup-timeout", type=float, default=60.0, help="Seconds to wait for the app")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate that fails the run")
+    parser.add_argument("--show-app-output", action="store_true", help="Print the app's stdout")
+    args = parser.parse_args()
+
+    gemini = StubGemini(args.llm_latency, args.llm_tokens_per_sec, args.llm_output_tokens).start()
+    tavily = StubTavily(args.search_latency).start()
+    gmail = StubGmail(args.gmail_latency).start()
+    smtp = StubSMTP(args.smtp_latency, args.smtp_handshake_latency).start()
+
+    with tempfile.TemporaryDirectory(prefix="contentpilot-load-") as workdir:
+        env = app_environment(args, gemini, tavily, gmail, smtp, workdir)
+        process, startup = start_app(env, args.port, args.startup_timeout, args.show_app_output)
+        try:
+            print(f"App started in {startup:.2f}s; "
+                  f"{args.generate} generate + {args.send_email} send-email requests"
+                  f"{f' + bulk send to {args.bulk_recipients}' if args.bulk_recipients else ''}, "
+                  f"concurrency {args.concurrency}, profile {args.profile}")
+            base_url = f"http://127.0.0.1:{args.port}"
+            samples, duration = asyncio.run(drive(
+                base_url, build_requests(args), args.concurrency, args.timeout
+            ))
+            email_ids = [s.email_id for s in samples if s.email_id]
+            if args.bulk_recipients:
+                bulk_sample, bulk_ids = asyncio.run(send_bulk(base_url, args.bulk_recipients, args.timeout))
+                samples.append(bulk_sample)
+                email_ids.extend(bulk_ids)
+            deliveries, delivery_span = asyncio.run(collect_deliveries(base_url, email_ids, args.timeout))
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+            for stub in (gemini, tavily, gmail, smtp):
+                stub.stop()
+
+    print("\nRequests")
+    error_rate = report(samples, duration)
+    if deliveries:
+        print("\nEmail delivery (queued to sent)")
+        delivery_error_rate = report(deliveries, delivery_span)
+        error_rate = max(error_rate, delivery_error_rate)
+    print(f"\nDuration {duration:.2f}s; stand-in requests: LLM {gemini.requests}, "
+          f"Tavily {tavily.requests}, Gmail {gmail.requests}, "
+          f"SMTP {smtp.requests} over {smtp.connections} connection(s)")
+    if error_rate > args.max_error_rate:
+        print(f"Error rate {error_rate:.1%} exceeds {args.max_error_rate:.1%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
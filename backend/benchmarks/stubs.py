@@ -0,0 +1,487 @@
+"""
+Stand-in Servers
+Local servers that emulate the Gemini, Tavily and Gmail APIs and an SMTP relay for load tests
+"""
+
+import base64
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from typing import Any, Dict, List, Optional
+
+WORDS = (
+    "sustainable travel choices support local communities protect natural places "
+    "and reduce emissions while keeping every journey memorable and affordable"
+).split()
+
+
+class StubServer:
+    """
+    Base for a stand-in API server running on a background thread
+
+    Subclasses set `handler_class` (and `server_class` for non-HTTP
+    protocols) and read their configuration from `self.server.stub`
+    inside the handler.
+    """
+
+    server_class = ThreadingHTTPServer
+    handler_class = BaseHTTPRequestHandler
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (port 0 picks a free port)
+
+        Args:
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.httpd = self.server_class((host, port), self.handler_class)
+        self.httpd.daemon_threads = True
+        self.httpd.stub = self
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self) -> None:
+        """Count one handled request"""
+        with self._lock:
+            self.requests += 1
+
+    def start(self) -> "StubServer":
+        """Start serving on a daemon thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """Request handler with JSON helpers and quiet logging"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep request logs out of the load test output"""
+
+    def read_json(self) -> Dict[str, Any]:
+        """Read the request body as JSON (empty dict if there is none)"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    def send_json(self, payload: Dict[str, Any], status: int = 200) -> None:
+        """Send a JSON response"""
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_text(tokens: int, offset: int = 0) -> List[str]:
+    """
+    Build filler text, one list item per token
+
+    Args:
+        tokens: Number of tokens (words)
+        offset: Position to start in the word list
+
+    Returns:
+        List[str]: Words, each with a trailing space
+    """
+    return [WORDS[(offset + i) % len(WORDS)] + " " for i in range(tokens)]
+
+
+class GeminiHandler(JSONHandler):
+    """
+    Emulates `models/{model}:generateContent` and `:streamGenerateContent`
+
+    When the request declares a search tool and the conversation has no
+    tool result yet, the reply is a single function call, so researcher
+    agents exercise the search path once before answering.
+    """
+
+    def do_POST(self) -> None:
+        """Answer a generation request"""
+        stub: StubGemini = self.server.stub
+        stub.count()
+        match = re.search(r"models/([^/:]+):(generateContent|streamGenerateContent)", self.path)
+        if not match:
+            self.send_json({"error": {"code": 404, "message": f"Unknown path {self.path}"}}, 404)
+            return
+
+        request = self.read_json()
+        prompt_tokens = max(1, len(json.dumps(request.get("contents", []))) // 4)
+        time.sleep(stub.latency)
+
+        function_call = stub.pick_function_call(request)
+        if function_call:
+            parts = [{"functionCall": function_call}]
+            reply = self._reply(parts, prompt_tokens, 8)
+            if match.group(2) == "streamGenerateContent":
+                self._start_stream()
+                self._send_event(reply)
+                self._end_stream()
+            else:
+                self.send_json(reply)
+            return
+
+        words = ["## Stub Content\n\n"] + make_text(stub.output_tokens)
+        if match.group(2) == "generateContent":
+            time.sleep(stub.output_tokens / stub.tokens_per_sec)
+            self.send_json(self._reply([{"text": "".join(words)}], prompt_tokens, stub.output_tokens))
+            return
+
+        self._start_stream()
+        step = stub.chunk_tokens
+        for start in range(0, len(words), step):
+            chunk = words[start:start + step]
+            time.sleep(len(chunk) / stub.tokens_per_sec)
+            last = start + step >= len(words)
+            self._send_event(self._reply(
+                [{"text": "".join(chunk)}],
+                prompt_tokens,
+                stub.output_tokens if last else 0,
+                finished=last
+            ))
+        self._end_stream()
+
+    @staticmethod
+    def _reply(
+        parts: List[Dict[str, Any]],
+        prompt_tokens: int,
+        output_tokens: int,
+        finished: bool = True
+    ) -> Dict[str, Any]:
+        """Build a GenerateContentResponse payload"""
+        candidate: Dict[str, Any] = {"content": {"role": "model", "parts": parts}, "index": 0}
+        if finished:
+            candidate["finishReason"] = "STOP"
+        return {
+            "candidates": [candidate],
+            "usageMetadata": {
+                "promptTokenCount": prompt_tokens,
+                "candidatesTokenCount": output_tokens,
+                "totalTokenCount": prompt_tokens + output_tokens
+            },
+            "modelVersion": "stub"
+        }
+
+    def _start_stream(self) -> None:
+        """Send the headers of a server-sent event stream"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_event(self, payload: Dict[str, Any]) -> None:
+        """Send one server-sent event as an HTTP chunk"""
+        data = f"data: {json.dumps(payload)}\r\n\r\n".encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_stream(self) -> None:
+        """Terminate the chunked response"""
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+
+class StubGemini(StubServer):
+    """
+    Stand-in for the Gemini API with configurable latency and token rate
+
+    Point the app at it with GOOGLE_GEMINI_BASE_URL.
+    """
+
+    handler_class = GeminiHandler
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        tokens_per_sec: float = 200.0,
+        output_tokens: int = 300,
+        chunk_tokens: int = 8,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Initialize the server
+
+        Args:
+            latency: Seconds before the first token (or function call) is sent
+            tokens_per_sec: Output token rate after the first token
+            output_tokens: Tokens in each text answer
+            chunk_tokens: Tokens per streamed chunk
+            host: Interface to bind
+            port: Port to bind
+        """
+        super().__init__(host, port)
+        self.latency = latency
+        self.tokens_per_sec = tokens_per_sec
+        self.output_tokens = output_tokens
+        self.chunk_tokens = chunk_tokens
+
+    @staticmethod
+    def pick_function_call(request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Choose a search call to make, if the request allows one
+
+        Args:
+            request: GenerateContentRequest payload
+
+        Returns:
+            Optional[Dict]: FunctionCall payload, or None to answer with text
+        """
+        for content in request.get("contents", []):
+            for part in content.get("parts", []):
+                if "functionResponse" in part or "function_response" in part:
+                    return None
+
+        for tool in request.get("tools", []):
+            for declaration in tool.get("functionDeclarations", tool.get("function_declarations", [])):
+                schema = (
+                    declaration.get("parameters")
+                    or declaration.get("parametersJsonSchema")
+                    or declaration.get("parameters_json_schema")
+                    or {}
+                )
+                properties = schema.get("properties", {})
+                if "query" in properties:
+                    text = json.dumps(request.get("contents", []))
+                    topic = re.search(r"[Tt]opics?:?\s*([A-Za-z0-9 #'-]{3,60})", text)
+                    query = topic.group(1).strip() if topic else "sustainable travel"
+                    return {"name": declaration["name"], "args": {"query": f"{query} trends"}}
+        return None
+
+
+class TavilyHandler(JSONHandler):
+    """Emulates Tavily's POST /search"""
+
+    def do_POST(self) -> None:
+        """Answer a search request"""
+        stub: StubTavily = self.server.stub
+        stub.count()
+        if not self.path.startswith("/search"):
+            self.send_json({"detail": f"Unknown path {self.path}"}, 404)
+            return
+
+        request = self.read_json()
+        time.sleep(stub.latency)
+        query = request.get("query", "")
+        results = [
+            {
+                "title": f"Result {i + 1} for {query}",
+                "url": f"https://example.com/{i + 1}",
+                "content": "".join(make_text(80, offset=i)),
+                "score": round(0.9 - i * 0.1, 2)
+            }
+            for i in range(int(request.get("max_results") or 3))
+        ]
+        self.send_json({"query": query, "results": results, "response_time": stub.latency})
+
+
+class StubTavily(StubServer):
+    """
+    Stand-in for the Tavily search API
+
+    Point the app at it with TAVILY_API_URL.
+    """
+
+    handler_class = TavilyHandler
+
+    def __init__(self, latency: float = 0.3, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server
+
+        Args:
+            latency: Seconds per search
+            host: Interface to bind
+            port: Port to bind
+        """
+        super().__init__(host, port)
+        self.latency = latency
+
+
+class GmailHandler(JSONHandler):
+    """Emulates Gmail's POST /gmail/v1/users/{userId}/messages/send"""
+
+    def do_POST(self) -> None:
+        """Accept a message"""
+        stub: StubGmail = self.server.stub
+        stub.count()
+        if not re.search(r"/gmail/v1/users/[^/]+/messages/send", self.path):
+            self.send_json({"error": {"code": 404, "message": f"Unknown path {self.path}"}}, 404)
+            return
+
+        self.read_json()
+        time.sleep(stub.latency)
+        self.send_json({"id": f"stub-{stub.requests}", "threadId": f"stub-{stub.requests}", "labelIds": ["SENT"]})
+
+
+class StubGmail(StubServer):
+    """
+    Stand-in for the Gmail API
+
+    Point the app at it with GMAIL_API_ENDPOINT.
+    """
+
+    handler_class = GmailHandler
+
+    def __init__(self, latency: float = 0.2, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server
+
+        Args:
+            latency: Seconds per send
+            host: Interface to bind
+            port: Port to bind
+        """
+        super().__init__(host, port)
+        self.latency = latency
+
+
+class SMTPHandler(StreamRequestHandler):
+    """
+    Emulates an ESMTP relay session: EHLO, AUTH PLAIN/LOGIN, MAIL, RCPT, DATA, RSET, NOOP and QUIT
+
+    The handshake latency is spent once per connection (half before the
+    greeting, half on AUTH), standing in for the TCP, TLS and login round
+    trips of a real relay.
+    """
+
+    def handle(self) -> None:
+        """Serve one SMTP session"""
+        stub: StubSMTP = self.server.stub
+        stub.count_connection()
+        time.sleep(stub.handshake_latency / 2)
+        self.reply("220 stub ESMTP ready")
+        authenticated = stub.username is None
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb, _, arg = line.decode().strip().partition(" ")
+            verb = verb.upper()
+            if verb == "EHLO":
+                self.reply("250-stub", "250-AUTH PLAIN LOGIN", "250-8BITMIME", "250 SIZE 10485760")
+            elif verb == "HELO":
+                self.reply("250 stub")
+            elif verb == "AUTH":
+                authenticated = self.authenticate(stub, arg)
+            elif verb in ("MAIL", "RCPT"):
+                self.reply("250 OK" if authenticated else "530 Authentication required")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                time.sleep(stub.latency)
+                stub.count()
+                self.reply(f"250 OK queued as stub-{stub.requests}")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply(f"502 Command {verb} not implemented")
+
+    def reply(self, *lines: str) -> None:
+        """Send one (possibly multiline) reply"""
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+    def authenticate(self, stub: "StubSMTP", arg: str) -> bool:
+        """Run an AUTH PLAIN or AUTH LOGIN exchange"""
+        mechanism, _, initial = arg.partition(" ")
+        if mechanism.upper() == "PLAIN":
+            if not initial:
+                self.reply("334 ")
+                initial = self.rfile.readline().decode().strip()
+            _, username, password = base64.b64decode(initial).decode().split("\0")
+        elif mechanism.upper() == "LOGIN":
+            if not initial:
+                self.reply("334 VXNlcm5hbWU6")
+                initial = self.rfile.readline().decode().strip()
+            username = base64.b64decode(initial).decode()
+            self.reply("334 UGFzc3dvcmQ6")
+            password = base64.b64decode(self.rfile.readline().strip()).decode()
+        else:
+            self.reply("504 Unrecognized authentication type")
+            return False
+
+        time.sleep(stub.handshake_latency / 2)
+        if (username, password) != (stub.username, stub.password):
+            self.reply("535 Authentication credentials invalid")
+            return False
+        stub.count_login()
+        self.reply("235 Authentication successful")
+        return True
+
+
+class StubSMTP(StubServer):
+    """
+    Stand-in for an SMTP relay that accepts every message
+
+    Point the app at it with EMAIL_BACKEND=smtp, SMTP_SERVER and SMTP_PORT
+    (plus SMTP_USER and SMTP_PASSWORD if a username is set).
+    """
+
+    server_class = ThreadingTCPServer
+    handler_class = SMTPHandler
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        handshake_latency: float = 0.3,
+        username: Optional[str] = "load-test",
+        password: str = "load-test",
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """
+        Initialize the server
+
+        Args:
+            latency: Seconds per accepted message
+            handshake_latency: Seconds per new connection (greeting plus login)
+            username: Required login (None accepts unauthenticated sessions)
+            password: Required password
+            host: Interface to bind
+            port: Port to bind
+        """
+        super().__init__(host, port)
+        self.latency = latency
+        self.handshake_latency = handshake_latency
+        self.username = username
+        self.password = password
+        self.connections = 0
+        self.logins = 0
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on"""
+        return self.httpd.server_address[1]
+
+    def count_connection(self) -> None:
+        """Count one accepted connection"""
+        with self._lock:
+            self.connections += 1
+
+    def count_login(self) -> None:
+        """Count one successful login"""
+        with self._lock:
+            self.logins += 1
@@ -392,9 +392,9 @@ export default function GeneratePage() {
                                             <div className="h-4 w-[1px] bg-white/10" />
                                             <span className="text-sm font-medium text-slate-400">Generated Content.md</span>
                                         </div>
-                                        {result.email_sent && (
+                                        {(result.email_sent || result.email_id) && (
                                             <span className="text-xs text-green-400 bg-green-500/10 px-3 py-1 rounded-full border border-green-500/20 flex items-center gap-2">
-                                                <Mail className="w-3 h-3" /> Email Sent
+                                                <Mail className="w-3 h-3" /> {result.email_sent ? 'Email Sent' : 'Email Queued'}
                                             </span>
                                         )}
                                     </div>